@@ -1,11 +1,10 @@
 """Main data description that describes a turbine."""
 
-import inspect
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True)
 class Turbine:
     """Turbine description in location database."""
 
@@ -40,11 +39,12 @@ class Turbine:
 
     def to_dict(self):
         """Converts a Turbine to a dict."""
-        return dict(asdict(self).items())
+        # Fields are (immutable) scalars, so no deep copy (like asdict) is needed
+        return {field: getattr(self, field) for field in self.__dataclass_fields__}
 
     @classmethod
     def from_dict(cls, data: dict):
         """Gets a Turbine from a dict."""
-        params = inspect.signature(cls).parameters
+        params = cls.__dataclass_fields__
 
         return cls(**{k: v for k, v in data.items() if k in params})
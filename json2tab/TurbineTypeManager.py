@@ -348,11 +348,12 @@ class TurbineTypeManager:
             logger.info(
                 f"Compute model designation for all specs based on source={source_name}"
             )
+            designations = [
+                build_model_designation_from_rowdata(row, source_name)
+                for row in specs_df.to_dict("records")
+            ]
             specs_df["model_designation"], specs_df["is_known_manufacturer"] = zip(
-                *specs_df.apply(
-                    lambda row: build_model_designation_from_rowdata(row, source_name),
-                    axis=1,
-                )
+                *designations
             )
         else:
             logger.warning(
@@ -225,6 +225,14 @@ def main(argv=None):
             default=None,
         )
 
+        parser.add_argument(
+            "--jobs",
+            metavar="N",
+            type=int,
+            help="Number of processes to convert multiple input files in parallel",
+            default=1,
+        )
+
     if converter is not None or location_merger is not None:
         parser.add_argument(
             "--min-distance",
@@ -380,6 +388,7 @@ def main(argv=None):
                 rename_rules=args.rename_columns,
                 write_columns=args.write_columns,
                 min_distance=args.min_distance,
+                jobs=args.jobs,
             )
         else:
             logger.warning("Loading converter failed; please install optional packages.")
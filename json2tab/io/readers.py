@@ -2,18 +2,41 @@
 
 import json
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional
 
 import pandas as pd
 
+try:
+    import geopandas as gpd
+except ImportError:
+    gpd = None
+
+try:
+    import pyogrio
+except ImportError:
+    pyogrio = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
 from ..logs import logger
 from ..Turbine import Turbine
+from ..turbine_utils import categorize_static_columns
 
 
 def read_locationdata_as_dataframe(
     input_filename: str,
     ext: Optional[str] = None,
     rename_rules: Optional[str | dict] = None,
+    categorize: bool = False,
 ) -> pd.DataFrame:
     """Reads dataframe with wind turbine location data from a file.
 
@@ -21,6 +44,8 @@ def read_locationdata_as_dataframe(
         input_filename (str):    Filename with wind turbine location data
         ext (str):               Extension used to determine reader, default: None(=auto)
         rename_rules (str|dict): Rename rules to rename columns in read data
+        categorize (bool):       Flag indicating to store the country and source
+                                 columns as category (to save memory)
 
     Returns:
         pandas.DataFrame with wind turbine location data
@@ -47,6 +72,9 @@ def read_locationdata_as_dataframe(
     if data is not None:
         data = data.rename(columns=parse_rules(rename_rules))
 
+        if categorize:
+            data = categorize_static_columns(data)
+
     return data
 
 
@@ -117,18 +145,25 @@ def read_locationdata_from_tab_as_dataframe(input_filename: str) -> pd.DataFrame
         logger.exception("Detailed error information:")
 
 
-def read_locationdata_from_csv_as_dataframe(input_filename: str) -> pd.DataFrame:
+def read_locationdata_from_csv_as_dataframe(
+    input_filename: str, chunksize: Optional[int] = None
+) -> pd.DataFrame | Iterator[pd.DataFrame]:
     """Reads dataframe with wind turbine location data from a CSV file.
 
     Args:
         input_filename (str): Filename with wind turbine location data
+        chunksize (int):      (Optional) Number of rows per chunk; if given, an
+                              iterator over dataframes per chunk is returned
 
     Returns:
-        pandas.DataFrame with wind turbine location data
+        pandas.DataFrame (or iterator over chunks) with wind turbine location data
     """
+    if chunksize is not None:
+        return _read_locationdata_from_csv_in_chunks(input_filename, chunksize)
+
     try:
         logger.debug(f"Read inputfile '{input_filename}' as csv-file")
-        data = pd.read_csv(input_filename)
+        data = read_csv(input_filename)
 
         if len(data.columns) == 1:
             # Probably a wrong separator, let Python guess a proper separator
@@ -145,6 +180,38 @@ def read_locationdata_from_csv_as_dataframe(input_filename: str) -> pd.DataFrame
         logger.exception("Detailed error information:")
 
 
+def _read_locationdata_from_csv_in_chunks(
+    input_filename: str, chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """Reads wind turbine location data from a CSV file in chunks of rows."""
+    logger.debug(
+        f"Read inputfile '{input_filename}' as csv-file in chunks of {chunksize} rows"
+    )
+
+    try:
+        header = pd.read_csv(input_filename, nrows=0)
+    except pd.errors.EmptyDataError:
+        logger.error(f"No data in csv-file {input_filename}")
+        return
+
+    kwargs = {}
+    if len(header.columns) == 1:
+        # Probably a wrong separator, let Python guess a proper separator
+        kwargs = {"sep": None, "engine": "python"}
+
+    _, source = os.path.split(input_filename)
+    n_turbines = 0
+    with pd.read_csv(input_filename, chunksize=chunksize, **kwargs) as reader:
+        for chunk in reader:
+            if "source" not in chunk.columns:
+                chunk["source"] = source
+
+            n_turbines += len(chunk.index)
+            yield chunk
+
+    logger.info(f"Loaded {n_turbines} turbines from {input_filename}")
+
+
 def read_locationdata_from_geojson_as_dataframe(input_filename: str) -> pd.DataFrame:
     """Reads dataframe with wind turbine location data from a GeoJSON file.
 
@@ -191,6 +258,72 @@ def read_locationdata_from_geojson_as_dataframe(input_filename: str) -> pd.DataF
         logger.exception("Detailed error information:")
 
 
+def read_geodataframe(input_filename: str, **kwargs) -> "gpd.GeoDataFrame":
+    """Reads a geospatial file (shapefile, GeoJSON, ...) as geopandas.GeoDataFrame.
+
+    Uses the pyogrio engine with Arrow streaming when these packages are available,
+    otherwise falls back to the default engine of geopandas.
+
+    Args:
+        input_filename (str): Filename of the geospatial file
+        kwargs:               Additional keyword arguments for geopandas.read_file
+
+    Returns:
+        geopandas.GeoDataFrame with the content of the file
+    """
+    if pyogrio is not None:
+        kwargs.setdefault("engine", "pyogrio")
+        if pyarrow is not None:
+            kwargs.setdefault("use_arrow", True)
+
+    logger.debug(f"Read inputfile '{input_filename}' with options {kwargs}")
+    return gpd.read_file(input_filename, **kwargs)
+
+
+def read_csv(input_filename: str, **kwargs) -> pd.DataFrame:
+    """Reads a CSV file as pandas.DataFrame.
+
+    Uses the (multi-threaded) pyarrow engine when pyarrow is available and no other
+    engine or chunked reading is requested, otherwise falls back to the default
+    engine of pandas; also when pyarrow fails to parse the file.
+
+    Args:
+        input_filename (str): Filename of the CSV file
+        kwargs:               Additional keyword arguments for pandas.read_csv
+
+    Returns:
+        pandas.DataFrame with the content of the file
+    """
+    if pyarrow is not None and "engine" not in kwargs and "chunksize" not in kwargs:
+        try:
+            logger.debug(f"Read inputfile '{input_filename}' with pyarrow engine")
+            return pd.read_csv(input_filename, engine="pyarrow", **kwargs)
+        except (pd.errors.ParserError, pyarrow.ArrowInvalid) as e:
+            logger.debug(f"Retry with default engine as pyarrow failed: {e}")
+
+    return pd.read_csv(input_filename, **kwargs)
+
+
+def read_excel(input_filename: str, **kwargs) -> pd.DataFrame:
+    """Reads an Excel file as pandas.DataFrame.
+
+    Uses the (Rust based) calamine engine when python-calamine is available,
+    otherwise falls back to the default engine of pandas (openpyxl).
+
+    Args:
+        input_filename (str): Filename of the Excel file
+        kwargs:               Additional keyword arguments for pandas.read_excel
+
+    Returns:
+        pandas.DataFrame with the content of the (requested sheet of the) file
+    """
+    if python_calamine is not None:
+        kwargs.setdefault("engine", "calamine")
+
+    logger.debug(f"Read inputfile '{input_filename}' with options {kwargs}")
+    return pd.read_excel(input_filename, **kwargs)
+
+
 def parse_rules(rules: str | dict) -> dict:
     """Parses a rules string to a dicationay."""
     if rules is None:
@@ -199,6 +332,13 @@ def parse_rules(rules: str | dict) -> dict:
     if isinstance(rules, dict):
         return rules
 
+    # Return a copy, so callers cannot modify the cached rules
+    return dict(_parse_rules_string(rules))
+
+
+@lru_cache(maxsize=32)
+def _parse_rules_string(rules: str) -> dict:
+    """Parses (and caches) a rules string like "key1=value1,key2=value2"."""
     syms = "'\" "
     rule_dict = {}
 
@@ -8,17 +8,21 @@ from ..logs import logger
 
 
 def save_dataframe_as_csv(
-    data: pd.DataFrame, output_file: str = "wind_turbines.csv"
+    data: pd.DataFrame, output_file: str = "wind_turbines.csv", append: bool = False
 ) -> None:
     """Save dataframe with wind turbine location data as a CSV file.
 
     Args:
         data (pandas.DataFrame): DataFrame containing wind turbine data
         output_file (str):       Path for the output CSV file
+        append (bool):           Flag indicating to append data (without header)
+                                 to an existing CSV file
     """
     try:
         logger.info("Writing data to CSV file...")
-        data.to_csv(output_file, index=False)
+        data.to_csv(
+            output_file, index=False, mode="a" if append else "w", header=not append
+        )
 
         # Log success and file size
         file_size = os.path.getsize(output_file) / (1024 * 1024)  # Convert to MB
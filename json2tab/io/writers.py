@@ -29,7 +29,10 @@ def generate_output_filename(input_filename: str, output_extension: str) -> str:
 
 
 def save_dataframe(
-    dataframe: pd.DataFrame, filename: str, formats: Optional[str | List[str]] = None
+    dataframe: pd.DataFrame,
+    filename: str,
+    formats: Optional[str | List[str]] = None,
+    append: bool = False,
 ) -> None:
     """Save dataframe to filename in given format.
 
@@ -37,6 +40,8 @@ def save_dataframe(
         dataframe (pandas.DataFrame): pandas.DataFrame to write
         filename (str):               Filename to write data
         formats (str or list[str]):   One or more formats to write dataframe
+        append (bool):                Flag indicating to append data to an existing
+                                      file (only supported for csv)
 
     """
     if formats is None:
@@ -47,9 +52,15 @@ def save_dataframe(
     for ext in formats:
         output_filename = generate_output_filename(filename, ext)
         if ext.lower() in ["csv", ".csv"]:
-            save_dataframe_as_csv(dataframe, output_filename)
+            save_dataframe_as_csv(dataframe, output_filename, append=append)
         elif ext.lower() in ["json", ".json", "geojson", ".geojson"]:
-            save_dataframe_as_geojson(dataframe, output_filename)
+            if append:
+                logger.warning(
+                    f"Cannot append data to geojson file {output_filename}. "
+                    "No file written."
+                )
+            else:
+                save_dataframe_as_geojson(dataframe, output_filename)
         else:
             logger.warning(
                 f"Could not derive valid output format for extension {ext}. "
@@ -57,6 +68,35 @@ def save_dataframe(
             )
 
 
+def save_dataframe_in_place(dataframe: pd.DataFrame, filename: str) -> str:
+    """Overwrite a file with dataframe, keeping the original file as backup.
+
+    The original file is moved (instead of copied) to `<filename>.orig`, as its
+    content is already loaded; if writing fails, the original file is restored.
+
+    Args:
+        dataframe (pandas.DataFrame): pandas.DataFrame to write
+        filename (str):               Filename to overwrite with the data
+
+    Returns:
+        The filename of the backup of the original file
+    """
+    backup_filename = f"{filename}.orig"
+
+    os.replace(filename, backup_filename)
+    logger.info(f"Moved original file {filename} to {backup_filename}")
+
+    try:
+        save_dataframe(dataframe, filename)
+    finally:
+        if not os.path.exists(filename):
+            # Writing failed; restore the original file
+            os.replace(backup_filename, filename)
+            logger.error(f"Failed to write {filename}; restored original file")
+
+    return backup_filename
+
+
 def parse_ext_string_to_list(formats: str) -> List[str]:
     """Parses extensions like .[csv,txt] as a list of extensions."""
     if formats.startswith(".[") and formats.endswith("]"):
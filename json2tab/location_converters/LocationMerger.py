@@ -126,14 +126,18 @@ def location_merger(
         df_file1_unique is not None
         and len(set(df_file1_unique.columns) - turbine_keys) > 0
     ):
-        file1_unique = df_file1_unique.apply(datarow_to_turbine, axis=1).to_list()
+        file1_unique = [
+            datarow_to_turbine(row) for row in df_file1_unique.to_dict("records")
+        ]
         df_file1_unique = None
 
     if (
         df_file2_unique is not None
         and len(set(df_file2_unique.columns) - turbine_keys) > 0
     ):
-        file2_unique = df_file2_unique.apply(datarow_to_turbine, axis=1).to_list()
+        file2_unique = [
+            datarow_to_turbine(row) for row in df_file2_unique.to_dict("records")
+        ]
         df_file2_unique = None
 
     unique1 = len(file1_unique) + (
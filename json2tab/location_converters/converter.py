@@ -1,7 +1,10 @@
 """Module containing front end of windturbine location file converters."""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import List, Optional
 
+from ..io.readers import parse_rules
 from ..location_converters.convert_between_csv_geojson import convert_between_csv_geojson
 from ..location_converters.country_data.austria import austria
 from ..location_converters.country_data.denmark import denmark
@@ -25,19 +28,12 @@ from ..location_converters.osm_data_fetcher import osm_data_fetcher
 from ..location_converters.short_distance_remover import short_distance_remover
 from ..location_converters.wf101_location_converter import wf101_location_converter
 
-supported_conversion_types: List[str] = sorted(
-    [
-        "fix_country",
-        "fix_onshore",
-        "fix_offshore",
-        "fix_is_offshore",
-        "fix_country_offshore",
-        "fix_country_is_offshore",
-        "netherlands",
-        "osm",
-        "osm_windturbine",
-        "osm_windfarm",
-        "osm_windturbine_windfarm",
+_FIX_COUNTRY_OFFSHORE_TYPES = frozenset(
+    {"fix_country_offshore", "fix_country_is_offshore"}
+)
+_FIX_OFFSHORE_TYPES = frozenset({"fix_offshore", "fix_onshore", "fix_is_offshore"})
+_CSV_GEOJSON_TYPES = frozenset(
+    {
         "csv2geojson",
         "csv_to_geojson",
         "geojson2csv",
@@ -46,8 +42,28 @@ supported_conversion_types: List[str] = sorted(
         "tab_to_csv",
         "txt2csv",
         "txt_to_csv",
-        "csv2csv",
-        "csv_to_csv",
+    }
+)
+_CSV_CSV_TYPES = frozenset({"csv2csv", "csv_to_csv"})
+_THEWINDPOWER_TYPES = frozenset({"twp", "thewindpower", "thewindpower.net"})
+_UNITED_KINGDOM_TYPES = frozenset({"uk", "unitedkingdom", "united_kingdom"})
+_WF101_TYPES = frozenset({"wf2csv", "wf101_to_csv", "wf2geojson", "wf101_to_geojson"})
+
+supported_conversion_types: List[str] = sorted(
+    _FIX_COUNTRY_OFFSHORE_TYPES
+    | _FIX_OFFSHORE_TYPES
+    | _CSV_GEOJSON_TYPES
+    | _CSV_CSV_TYPES
+    | _THEWINDPOWER_TYPES
+    | _UNITED_KINGDOM_TYPES
+    | _WF101_TYPES
+    | {
+        "fix_country",
+        "netherlands",
+        "osm",
+        "osm_windturbine",
+        "osm_windfarm",
+        "osm_windturbine_windfarm",
         "austria",
         "denmark",
         "finland",
@@ -55,23 +71,12 @@ supported_conversion_types: List[str] = sorted(
         "germany",
         "italy",
         "sweden",
-        "uk",
-        "uk",
-        "unitedkingdom",
-        "united_kingdom",
-        "twp",
-        "thewindpower",
-        "thewindpower.net",
-        "wf2csv",
-        "wf101_to_csv",
-        "wf2geojson",
-        "wf101_to_geojson",
         "remove_short_distance",
         "select_country",
         "remove_country",
         "select_onshore",
         "select_offshore",
-    ]
+    }
 )
 """Supported `convert_type` that the converter can process. """
 
@@ -84,6 +89,7 @@ def converter(
     rename_rules: Optional[str | dict] = None,
     write_columns: Optional[str | dict] = None,
     min_distance: Optional[float] = None,
+    jobs: Optional[int] = 1,
 ):
     """Entry point for different converters.
 
@@ -97,15 +103,17 @@ def converter(
         rename_rules (str | dict):         Rename rules to rename columns in input
         write_columns (str | dict):        Inject rules to write columns in output
         min_distance (float):              Min distance for remove_short_distance
+        jobs (int):                        Number of worker processes used to convert
+                                           multiple input files in parallel
     """
     # Process first multi-input file converters
-    if convert_type in ["fix_country_offshore", "fix_country_is_offshore"]:
+    if convert_type in _FIX_COUNTRY_OFFSHORE_TYPES:
         fix_country_offshore(
             input_filenames, output_filename, update_country=True, update_is_offshore=True
         )
     elif convert_type == "fix_country":
         fix_country_offshore(input_filenames, output_filename, update_country=True)
-    elif convert_type in ["fix_offshore", "fix_onshore", "fix_is_offshore"]:
+    elif convert_type in _FIX_OFFSHORE_TYPES:
         fix_country_offshore(input_filenames, output_filename, update_is_offshore=True)
     elif convert_type == "netherlands":
         rivm_file = input_filenames[0]
@@ -143,76 +151,105 @@ def converter(
         if len(input_filenames) > 1:
             output_filename = None
 
-        for input_filename in input_filenames:
-            if convert_type in [
-                "csv2geojson",
-                "csv_to_geojson",
-                "geojson2csv",
-                "geojson_to_csv",
-                "tab2csv",
-                "tab_to_csv",
-                "txt2csv" "txt_to_csv",
-            ]:
-                convert_between_csv_geojson(
-                    input_filename, output_filename, rename_rules=rename_rules
-                )
-
-            elif convert_type in ["csv2csv", "csv_to_csv"]:
-                csv_to_csv(
+        # Parse rules once for all input files
+        if rename_rules is not None:
+            rename_rules = parse_rules(rename_rules)
+        if write_columns is not None:
+            write_columns = parse_rules(write_columns)
+
+        if jobs is not None and jobs > 1 and len(input_filenames) > 1:
+            dispatch = partial(
+                _single_file_dispatch,
+                convert_type,
+                output_filename=output_filename,
+                country=country,
+                rename_rules=rename_rules,
+                write_columns=write_columns,
+                min_distance=min_distance,
+            )
+            max_workers = min(jobs, len(input_filenames))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(dispatch, input_filenames))
+        else:
+            for input_filename in input_filenames:
+                _single_file_dispatch(
+                    convert_type,
                     input_filename,
-                    output_filename,
+                    output_filename=output_filename,
+                    country=country,
                     rename_rules=rename_rules,
                     write_columns=write_columns,
+                    min_distance=min_distance,
                 )
 
-            elif convert_type in ["twp", "thewindpower", "thewindpower.net"]:
-                thewindpower(input_filename, output_filename, rename_rules=rename_rules)
 
-            elif convert_type == "austria":
-                austria(input_filename, output_filename)
+def _single_file_dispatch(
+    convert_type: str,
+    input_filename: str,
+    output_filename: Optional[str] = None,
+    country: Optional[str | List[str]] = None,
+    rename_rules: Optional[str | dict] = None,
+    write_columns: Optional[str | dict] = None,
+    min_distance: Optional[float] = None,
+):
+    """Run a single-input file converter on one input file.
 
-            elif convert_type == "denmark":
-                denmark(input_filename, output_filename)
+    Defined at module level so it can be pickled by `ProcessPoolExecutor`.
+    """
+    if convert_type in _CSV_GEOJSON_TYPES:
+        convert_between_csv_geojson(
+            input_filename, output_filename, rename_rules=rename_rules
+        )
 
-            elif convert_type == "finland":
-                finland(input_filename, output_filename)
+    elif convert_type in _CSV_CSV_TYPES:
+        csv_to_csv(
+            input_filename,
+            output_filename,
+            rename_rules=rename_rules,
+            write_columns=write_columns,
+        )
 
-            elif convert_type == "flanders":
-                flanders(input_filename, output_filename, min_distance=min_distance)
+    elif convert_type in _THEWINDPOWER_TYPES:
+        thewindpower(input_filename, output_filename, rename_rules=rename_rules)
 
-            elif convert_type == "germany":
-                germany(input_filename, output_filename)
+    elif convert_type == "austria":
+        austria(input_filename, output_filename)
 
-            elif convert_type == "italy":
-                italy(input_filename, output_filename)
+    elif convert_type == "denmark":
+        denmark(input_filename, output_filename)
 
-            elif convert_type == "sweden":
-                sweden(input_filename, output_filename)
+    elif convert_type == "finland":
+        finland(input_filename, output_filename)
 
-            elif convert_type in ["uk", "unitedkingdom", "united_kingdom"]:
-                united_kingdom(input_filename, output_filename)
+    elif convert_type == "flanders":
+        flanders(input_filename, output_filename, min_distance=min_distance)
 
-            elif convert_type in [
-                "wf2csv",
-                "wf101_to_csv",
-                "wf2geojson",
-                "wf101_to_geojson",
-            ]:
-                wf101_location_converter(input_filename, output_filename)
+    elif convert_type == "germany":
+        germany(input_filename, output_filename)
 
-            elif convert_type == "remove_short_distance":
-                short_distance_remover(
-                    input_filename, output_filename, min_distance=min_distance
-                )
+    elif convert_type == "italy":
+        italy(input_filename, output_filename)
+
+    elif convert_type == "sweden":
+        sweden(input_filename, output_filename)
+
+    elif convert_type in _UNITED_KINGDOM_TYPES:
+        united_kingdom(input_filename, output_filename)
+
+    elif convert_type in _WF101_TYPES:
+        wf101_location_converter(input_filename, output_filename)
+
+    elif convert_type == "remove_short_distance":
+        short_distance_remover(input_filename, output_filename, min_distance=min_distance)
 
-            elif convert_type == "select_country":
-                select_from_countries(input_filename, output_filename, country)
+    elif convert_type == "select_country":
+        select_from_countries(input_filename, output_filename, country)
 
-            elif convert_type == "remove_country":
-                remove_from_countries(input_filename, output_filename, country)
+    elif convert_type == "remove_country":
+        remove_from_countries(input_filename, output_filename, country)
 
-            elif convert_type == "select_offshore":
-                select_offshore(input_filename, output_filename)
+    elif convert_type == "select_offshore":
+        select_offshore(input_filename, output_filename)
 
-            elif convert_type == "select_onshore":
-                select_onshore(input_filename, output_filename)
+    elif convert_type == "select_onshore":
+        select_onshore(input_filename, output_filename)
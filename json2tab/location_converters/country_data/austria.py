@@ -20,6 +20,13 @@ except ImportError:
 from ...io.writers import save_dataframe
 from ...logs import logger, logging
 from ...Turbine import Turbine
+from ...turbine_utils import categorize_static_columns
+
+_N_TURBINES_PATTERN = re.compile(r"(?P<n_turbines>\d+) Anlage(n)")
+_START_YEAR_PATTERN = re.compile(r"errichtet: (?P<start_year>\d+)")
+_TYPE_PATTERN = re.compile(r"Type: (?P<man>[^,]*), (?P<type>.*)")
+_HUB_HEIGHT_PATTERN = re.compile(r"Nabenh.*he: (?P<hub_height>\d+)")
+_DIAMETER_PATTERN = re.compile(r"Rotordurchmesser: (?P<diameter>\d+)")
 
 
 def austria(
@@ -61,54 +68,32 @@ def austria(
 
     if data is not None:
         turbines = []
-        skipped_turbines = []
+        raw_lon = []
+        raw_lat = []
+        raw_power = []
         for properties_list in data.values():
             idx = 0
             for properties in properties_list:
                 idx += 1
 
-                prop_id = properties["id"]
-
-                lon = properties["x"]
-                try:
-                    if isinstance(lon, str):
-                        lon = float(lon.replace(",", "."))
-                except (ValueError, TypeError):
-                    pass
-
-                lat = properties["y"]
-                try:
-                    if isinstance(lat, str):
-                        lat = float(lat.replace(",", "."))
-                except (ValueError, TypeError):
-                    pass
-
-                rated_power = properties["mweinzeln"]
-                try:
-                    if isinstance(rated_power, float):
-                        # Convert MW powers to kW powers
-                        rated_power *= 1000
-                    if isinstance(rated_power, str):
-                        rated_power = float(rated_power.replace(",", ".")) * 1000
-                except (ValueError, TypeError):
-                    pass
+                raw_lon.append(properties["x"])
+                raw_lat.append(properties["y"])
+                raw_power.append(properties["mweinzeln"])
 
                 facilityInfo = properties["facilityInfo"]
 
                 n_turbines = 1
-                match = re.search(r"(?P<n_turbines>\d+) Anlage(n)", facilityInfo)
+                match = _N_TURBINES_PATTERN.search(facilityInfo)
                 if match:
-                    with contextlib.suppress(ValueError, TypeError):
-                        n_turbines = int(match.group("n_turbines"))
+                    n_turbines = int(match.group("n_turbines"))
 
                 start_date = None
-                match = re.search(r"errichtet: (?P<start_year>\d+)", facilityInfo)
+                match = _START_YEAR_PATTERN.search(facilityInfo)
                 if match:
-                    with contextlib.suppress(ValueError, TypeError):
-                        start_date = int(match.group("start_year"))
+                    start_date = int(match.group("start_year"))
 
                 typeInfo = properties["typeInfo"].split("<br>")
-                match = re.search(r"Type: (?P<man>[^,]*), (?P<type>.*)", typeInfo[0])
+                match = _TYPE_PATTERN.search(typeInfo[0])
                 if match:
                     manufacturer = match.group("man")
                     turbine_type = match.group("type")
@@ -117,33 +102,26 @@ def austria(
                     turbine_type = None
 
                 hub_height = None
-                match = re.search(r"Nabenh.*he: (?P<hub_height>\d+)", typeInfo[1])
+                match = _HUB_HEIGHT_PATTERN.search(typeInfo[1])
                 if match:
-                    with contextlib.suppress(ValueError, TypeError):
-                        hub_height = float(match.group("hub_height"))
+                    hub_height = float(match.group("hub_height"))
 
                 diameter = None
                 radius = None
-                match = re.search(r"Rotordurchmesser: (?P<diameter>\d+)", typeInfo[1])
+                match = _DIAMETER_PATTERN.search(typeInfo[1])
                 if match:
-                    try:
-                        diameter = float(match.group("diameter"))
-                        radius = diameter / 2
-                    except (ValueError, TypeError):
-                        pass
+                    diameter = float(match.group("diameter"))
+                    radius = diameter / 2
 
                 project = properties["project"]
 
                 turbine = Turbine(
-                    id=prop_id,
+                    id=properties["id"],
                     turbine_id=idx,
-                    latitude=lat,
-                    longitude=lon,
                     name=f"Turbine {idx} in '{project}'",
                     country="Austria",
                     source=label_source,
                     hub_height=hub_height,
-                    power_rating=rated_power,
                     radius=radius,
                     diameter=diameter,
                     manufacturer=manufacturer,
@@ -153,29 +131,50 @@ def austria(
                     start_date=start_date,
                     is_offshore=False,
                 )
-
-                if lat is not None and lon is not None:
-                    turbines.append(turbine)
-                else:
-                    logger.warning(
-                        f"Skipped turbine {turbine.name} (id={turbine.id}) "
-                        "due to invalid lat/lon."
-                    )
-                    skipped_turbines.append(turbine)
+                turbines.append(turbine)
 
         data = pd.DataFrame(turbines)
+        if len(data.index) == 0:
+            # No turbines (so no columns) to parse; write the empty output as is
+            save_dataframe(data, output_filename)
+            logger.warning("Skipped 0 turbines")
+            return data
+
+        # Parse the (possibly comma-decimal) coordinates and powers in one go
+        data["longitude"] = _parse_decimal_comma(raw_lon)
+        data["latitude"] = _parse_decimal_comma(raw_lat)
+
+        # Convert MW powers to kW powers
+        data["power_rating"] = _parse_decimal_comma(raw_power) * 1000
+
+        valid = data["latitude"].notna() & data["longitude"].notna()
+        skipped_turbines = data[~valid]
+        data = data[valid].reset_index(drop=True)
+
+        for name, turbine_id in zip(skipped_turbines["name"], skipped_turbines["id"]):
+            logger.warning(
+                f"Skipped turbine {name} (id={turbine_id}) due to invalid lat/lon."
+            )
+
+        data = categorize_static_columns(data)
         save_dataframe(data, output_filename)
 
         logger.warning(f"Skipped {len(skipped_turbines)} turbines")
         if len(skipped_turbines) > 0 and logger.getEffectiveLevel() <= logging.DEBUG:
-            save_dataframe(
-                pd.DataFrame(skipped_turbines), f"{output_filename}.skipped.csv"
-            )
+            save_dataframe(skipped_turbines, f"{output_filename}.skipped.csv")
 
         return data
     return None
 
 
+def _parse_decimal_comma(values: list) -> pd.Series:
+    """Parses a list of numbers or (comma-decimal) strings to floats."""
+    return pd.to_numeric(
+        pd.Series(values, dtype=object).astype(str).str.replace(",", ".", regex=False),
+        errors="coerce",
+    )
+
+
 def get_igwindkraft_windrad_karte(url: str) -> str:
     """Gets the json-string with windturbine data from igwindkraft website."""
     if requests is not None:
@@ -9,9 +9,12 @@ from typing import Optional
 import geopandas as gpd
 import pandas as pd
 
+from ...io.readers import read_excel
 from ...io.writers import save_dataframe
 from ...logs import logger
-from ...turbine_utils import datarow_to_turbine
+from ...turbine_utils import categorize_static_columns, datarow_to_turbine
+from ..get_lat_lon_matrix import has_valid_lat_lon
+from ..reproject_to_wgs84 import reproject_to_wgs84
 
 
 def denmark(
@@ -30,7 +33,7 @@ def denmark(
         _, label_source = os.path.split(input_filename)
     logger.info(f"Set source-field for {input_filename} to '{label_source}'")
 
-    data = pd.read_excel(input_filename, header=[6, 10])
+    data = read_excel(input_filename, header=[6, 10])
     data.columns = data.columns.droplevel(1)
     data.columns = data.columns.str.strip()
 
@@ -40,24 +43,20 @@ def denmark(
     if "country" not in data:
         data["country"] = "Denmark"
 
-    x = data["X (east) coordinate\nUTM 32 Euref89"].to_numpy().tolist()
-    y = data["Y (north) coordinate\nUTM 32 Euref89"].to_numpy().tolist()
+    x = data["X (east) coordinate\nUTM 32 Euref89"].to_numpy(dtype=float)
+    y = data["Y (north) coordinate\nUTM 32 Euref89"].to_numpy(dtype=float)
 
     geometry = gpd.points_from_xy(x, y, crs="EPSG:25832")
     geo_data = gpd.GeoDataFrame(data, geometry=geometry)
 
     # Project data to WGS84 coordinate system
-    geo_data.to_crs(crs="EPSG:4326", inplace=True)
-
-    turbines = []
-    for _, row in geo_data.iterrows():
-        turbine = datarow_to_turbine(row)
-        if (
-            turbine.latitude == turbine.latitude
-            and turbine.longitude == turbine.longitude
-        ):
-            turbines.append(turbine)
-
-    data = pd.DataFrame(turbines)
+    geo_data = reproject_to_wgs84(geo_data)
+
+    # Drop turbines without a valid location before converting them to turbines
+    geo_data = geo_data[has_valid_lat_lon(geo_data)]
+
+    turbines = [datarow_to_turbine(row) for row in geo_data.to_dict("records")]
+
+    data = categorize_static_columns(pd.DataFrame(turbines))
     save_dataframe(data, output_filename)
     return data
@@ -9,9 +9,14 @@ from typing import Optional
 
 import pandas as pd
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from ...io.writers import save_dataframe
 from ...logs import logger
-from ...turbine_utils import datarow_to_turbine
+from ...turbine_utils import categorize_static_columns, datarow_to_turbine
 
 
 def finland(
@@ -30,32 +35,36 @@ def finland(
         _, label_source = os.path.split(input_filename)
     logger.info(f"Set source-field for {input_filename} to '{label_source}'")
 
-    with open(input_filename, "r") as input_file:
-        data = json.load(input_file)
-
-        elements = data["features"]
+    with open(input_filename, "rb") as input_file:
+        if ijson is not None:
+            # Stream the features one by one, so only the turbines in operation
+            # are kept in memory
+            elements = ijson.items(input_file, "features.item", use_float=True)
+        else:
+            elements = json.load(input_file)["features"]
 
         turbines = []
         for element in elements:
             properties = element["properties"]
+            if properties["status"] != "in operation":
+                continue
 
-            if properties["status"] == "in operation":
-                location = element["geometry"]
-                lon, lat = location["coordinates"]
+            location = element["geometry"]
+            lon, lat = location["coordinates"]
 
-                turbine_id = properties["turbine id"]
-                windfarm_id = properties["farm id"]
+            turbine_id = properties["turbine id"]
+            windfarm_id = properties["farm id"]
 
-                properties["id"] = element["id"]
-                properties["name"] = f"Turbine {windfarm_id}.{turbine_id}"
-                properties["latitude"] = lat
-                properties["longitude"] = lon
-                properties["country"] = "Finland"
-                if "source" not in properties:
-                    properties["source"] = label_source
+            properties["id"] = element["id"]
+            properties["name"] = f"Turbine {windfarm_id}.{turbine_id}"
+            properties["latitude"] = lat
+            properties["longitude"] = lon
+            properties["country"] = "Finland"
+            if "source" not in properties:
+                properties["source"] = label_source
 
-                turbines.append(datarow_to_turbine(properties))
+            turbines.append(datarow_to_turbine(properties))
 
-        data = pd.DataFrame(turbines)
-        save_dataframe(data, output_filename)
-        return data
+    data = categorize_static_columns(pd.DataFrame(turbines))
+    save_dataframe(data, output_filename)
+    return data
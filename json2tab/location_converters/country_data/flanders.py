@@ -6,12 +6,14 @@ Input data based on stedenbouwkundig aangevraagde windturbines.
 import os
 from typing import Optional
 
-import geopandas as gpd
+import numpy as np
 import pandas as pd
 
+from ...io.readers import read_geodataframe
 from ...io.writers import save_dataframe
 from ...logs import logger
-from ...turbine_utils import datarow_to_turbine
+from ...turbine_utils import categorize_static_columns, standarize_dataframe
+from ..reproject_to_wgs84 import reproject_to_wgs84
 from ..short_distance_remover import cleanup_short_distance_turbines
 
 
@@ -44,10 +46,10 @@ def flanders(
     logger.debug(f"input filename: {input_filename}")
     logger.debug(f"output filename: {output_filename}")
 
-    data = gpd.read_file(input_filename)
+    data = read_geodataframe(input_filename)
 
     # Project data to WGS84 coordinate system
-    data.to_crs(crs="EPSG:4326", inplace=True)
+    data = reproject_to_wgs84(data)
 
     logger.info(f"Loaded {len(data)} wind turbines")
 
@@ -61,29 +63,23 @@ def flanders(
 
     logger.info(f"Selected {len(data)} wind turbines that are built")
 
-    turbines = []
-    for _, row in data.iterrows():
-        turbine = datarow_to_turbine(row)
+    max_height = data["hoogte_max"].replace(0, np.nan).to_numpy(dtype=float)
+    n_entries = len(data.index)
 
-        max_height = row["hoogte_max"]
-        if max_height == 0:
-            max_height = None
+    data = standarize_dataframe(data, always=True)
+    logger.info(f"Loaded {len(data.index)} turbines from {n_entries} data entries")
 
-        if turbine.power_rating == 0:
-            turbine.power_rating = None
+    # Treat zero power ratings and hub heights as unknown
+    data["power_rating"] = data["power_rating"].mask(data["power_rating"] == 0)
+    hub_height = pd.to_numeric(data["hub_height"].mask(data["hub_height"] == 0))
+    data["hub_height"] = hub_height
 
-        if turbine.hub_height == 0:
-            turbine.hub_height = None
+    # Derive the rotor size from the tip height and the hub height
+    has_height = hub_height.notna().to_numpy() & ~np.isnan(max_height)
+    radius = max_height[has_height] - hub_height.to_numpy()[has_height]
+    data.loc[has_height, "radius"] = radius
+    data.loc[has_height, "diameter"] = 2 * radius
 
-        if turbine.hub_height is not None and max_height is not None:
-            turbine.radius = max_height - turbine.hub_height
-            turbine.diameter = 2 * turbine.radius
-
-        turbines.append(turbine)
-
-    logger.info(f"Loaded {len(turbines)} turbines from {len(data.index)} data entries")
-
-    data = pd.DataFrame(turbines)
     logger.info(f"Created dataframe with {len(data.index)} turbines")
 
     if min_distance > 0:
@@ -94,5 +90,6 @@ def flanders(
             f"(i.e. {min_distance} degree) distance"
         )
 
+    data = categorize_static_columns(data)
     save_dataframe(data, output_filename)
     return data
@@ -7,11 +7,36 @@ import os
 from typing import Optional
 
 import pandas as pd
+from lxml import etree
 
 from ...io.writers import save_dataframe
 from ...logs import logger
 from ...Turbine import Turbine
 
+MASTR_TEXT_FIELDS = [
+    "EinheitMastrNummer",
+    "EegMaStRNummer",
+    "NameStromerzeugungseinheit",
+    "Typenbezeichnung",
+    "NameWindpark",
+    "InbetriebnahmedatumAmAktuellenStandort",
+    "Inbetriebnahmedatum",
+    "DatumEndgueltigeStilllegung",
+]
+"""Text fields read from the MaStR wind units."""
+
+MASTR_NUMERIC_FIELDS = [
+    "Breitengrad",
+    "Laengengrad",
+    "Nabenhoehe",
+    "Nettonennleistung",
+    "Bruttoleistung",
+    "Rotordurchmesser",
+    "Hersteller",
+    "WindAnLandOderAufSee",
+]
+"""Numeric fields (incl. catalog ids) read from the MaStR wind units."""
+
 
 def germany(
     input_filename: str,
@@ -40,68 +65,102 @@ def germany(
         _, label_source = os.path.split(input_filename)
     logger.info(f"Set source-field for {input_filename} to '{label_source}'")
 
-    df_in = pd.read_xml(input_filename, encoding="utf-16")
+    df_in = read_mastr_units(input_filename)
 
-    turbines = []
     logger.info(f"Processing {len(df_in.index)} wind turbines")
 
-    for _, row in df_in.iterrows():
-        manufacturer = get_value_from_catalog(katalog, row.get("Hersteller"))
-        if manufacturer == "Sonstige":
-            manufacturer = None
-
-        if manufacturer is not None:
-            # Cleanup some manufacturer strange values
-            manufacturer = manufacturer.replace("Deutschland", "")
-            manufacturer = manufacturer.replace("GmbH", "")
-            manufacturer = manufacturer.strip()
-
-        diameter = row.get("Rotordurchmesser")
-
-        turbine = Turbine(
-            id=row.get("EinheitMastrNummer"),
-            turbine_id=row.get("EegMaStRNummer"),
-            name=row.get("NameStromerzeugungseinheit"),
-            latitude=row.get("Breitengrad"),
-            longitude=row.get("Laengengrad"),
-            hub_height=row.get("Nabenhoehe"),
-            power_rating=row.get("Nettonennleistung") or row.get("Bruttoleistung"),
-            diameter=diameter,
-            radius=diameter / 2,
-            manufacturer=manufacturer,
-            type=row.get("Typenbezeichnung"),
-            wind_farm=row.get("NameWindpark"),
-            start_date=row.get("InbetriebnahmedatumAmAktuellenStandort")
-            or row.get("Inbetriebnahmedatum"),
-            end_date=row.get("DatumEndgueltigeStilllegung"),
-            source=label_source,
-            is_offshore=get_value_from_catalog(katalog, row.get("WindAnLandOderAufSee"))
-            == "Windkraft auf See",
-            country="Germany",
-        )
-
-        if (
-            (
-                turbine.latitude == turbine.latitude
-                and turbine.longitude == turbine.longitude
-            )
-            and turbine.start_date is not None
-            and turbine.start_date != ""
-        ):
-            turbines.append(turbine)
-
-    data = pd.DataFrame(turbines)
+    # Map catalog ids to their values; first occurrence wins for duplicate ids
+    katalog = katalog.drop_duplicates(subset="Id")
+    id_to_wert = dict(zip(katalog["Id"].to_numpy(), katalog["Wert"].to_numpy()))
+
+    manufacturer = df_in["Hersteller"].map(id_to_wert)
+    manufacturer = manufacturer.mask(manufacturer == "Sonstige")
+
+    # Cleanup some manufacturer strange values
+    manufacturer = (
+        manufacturer.str.replace("Deutschland", "", regex=False)
+        .str.replace("GmbH", "", regex=False)
+        .str.strip()
+    )
+
+    is_offshore = df_in["WindAnLandOderAufSee"].map(id_to_wert) == "Windkraft auf See"
+
+    net_power = df_in["Nettonennleistung"]
+    start_date = df_in["InbetriebnahmedatumAmAktuellenStandort"]
+    diameter = pd.to_numeric(df_in["Rotordurchmesser"])
+
+    data = pd.DataFrame(
+        {
+            "id": df_in["EinheitMastrNummer"],
+            "turbine_id": df_in["EegMaStRNummer"],
+            "name": df_in["NameStromerzeugungseinheit"],
+            "latitude": df_in["Breitengrad"],
+            "longitude": df_in["Laengengrad"],
+            "hub_height": df_in["Nabenhoehe"],
+            # Only a zero net power falls back; a missing net power stays missing
+            "power_rating": net_power.where(net_power != 0, df_in["Bruttoleistung"]),
+            "radius": diameter / 2,
+            "diameter": diameter,
+            "manufacturer": manufacturer,
+            "type": df_in["Typenbezeichnung"],
+            "wind_farm": df_in["NameWindpark"],
+            "start_date": start_date.mask(start_date == "").combine_first(
+                df_in["Inbetriebnahmedatum"]
+            ),
+            "end_date": df_in["DatumEndgueltigeStilllegung"],
+            "source": label_source,
+            "is_offshore": is_offshore,
+            "country": "Germany",
+        },
+        columns=list(Turbine().to_dict()),
+    )
+
+    # Only keep turbines with a location that are (or have been) in operation
+    valid = (
+        data["latitude"].notna()
+        & data["longitude"].notna()
+        & data["start_date"].notna()
+        & (data["start_date"] != "")
+    )
+    data = data[valid].reset_index(drop=True)
+
     save_dataframe(data, output_filename)
     return data
 
 
-def get_value_from_catalog(catalog, catalog_id):
-    """Gets value from catalog by catalog_id."""
-    if catalog_id is None:
-        return None
+def read_mastr_units(input_filename: str) -> pd.DataFrame:
+    """Stream-reads the wind units from a MaStR xml-file into a DataFrame.
+
+    Only the fields in `MASTR_TEXT_FIELDS` and `MASTR_NUMERIC_FIELDS` are kept and
+    every unit element is cleared after reading, so memory usage does not scale
+    with the full xml document.
+
+    Args:
+        input_filename (str): MaStR xml-file with wind units (e.g. EinheitenWind.xml)
+
+    Returns:
+        pandas.DataFrame with a row per wind unit
+    """
+    columns = {field: [] for field in MASTR_TEXT_FIELDS + MASTR_NUMERIC_FIELDS}
 
-    items = catalog[catalog["Id"] == catalog_id]
-    if len(items) > 0:
-        return items["Wert"].iloc[0]
+    root = None
+    depth = 0
+    for event, element in etree.iterparse(input_filename, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            depth += 1
+            continue
 
-    return None
+        depth -= 1
+        if depth == 1:
+            # Finished a unit element directly below the root element
+            for field, values in columns.items():
+                values.append(element.findtext(field))
+            root.clear()
+
+    data = pd.DataFrame(columns)
+    for field in MASTR_NUMERIC_FIELDS:
+        data[field] = pd.to_numeric(data[field], errors="coerce")
+
+    return data
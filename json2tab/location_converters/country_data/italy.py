@@ -5,9 +5,11 @@ from typing import Optional
 
 import pandas as pd
 
+from ...io.readers import read_excel
 from ...io.writers import save_dataframe
 from ...logs import logger
 from ...turbine_utils import datarow_to_turbine
+from ..get_lat_lon_matrix import has_valid_lat_lon
 
 
 def italy(
@@ -26,19 +28,15 @@ def italy(
         _, label_source = os.path.split(input_filename)
     logger.info(f"Set source-field for {input_filename} to '{label_source}'")
 
-    data = pd.read_excel(input_filename, header=1, sheet_name="db")
+    data = read_excel(input_filename, header=1, sheet_name="db")
 
     if "source" not in data:
         data["source"] = label_source
 
-    turbines = []
-    for _, row in data.iterrows():
-        turbine = datarow_to_turbine(row)
-        if (
-            turbine.latitude == turbine.latitude
-            and turbine.longitude == turbine.longitude
-        ):
-            turbines.append(turbine)
+    # Only keep turbines with a valid location
+    data = data[has_valid_lat_lon(data)]
+
+    turbines = [datarow_to_turbine(row) for row in data.to_dict("records")]
 
     data = pd.DataFrame(turbines)
     save_dataframe(data, output_filename)
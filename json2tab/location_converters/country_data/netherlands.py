@@ -4,20 +4,22 @@ Input data based on RIVM (onshore) and RWS (offshore) data.
 """
 
 import os
-from typing import Optional
+from typing import List, Optional
 
-import geopandas as gpd
+import numpy as np
 import pandas as pd
+from pyproj import Geod
+from scipy.spatial import KDTree
 
+from ...io.readers import read_geodataframe
 from ...io.writers import save_dataframe
-from ...location_converters.LocationMerger import (
-    get_nearest_turbine,
-    merge_dataframes,
-    merge_turbine_data,
-)
+from ...location_converters.get_lat_lon_matrix import get_lat_lon_matrix
+from ...location_converters.LocationMerger import merge_dataframes, merge_turbine_data
 from ...location_converters.MixStrategy import MixStrategy
 from ...logs import logger
+from ...Turbine import Turbine
 from ...turbine_utils import datarow_to_turbine
+from ..reproject_to_wgs84 import reproject_to_wgs84
 
 
 def netherlands(
@@ -54,12 +56,12 @@ def netherlands(
     logger.debug(f"RWS  input filename: {rws_input_filename}")
     logger.debug(f"output filename: {output_filename}")
 
-    rivm_data = gpd.read_file(rivm_input_filename)
-    rws_data = gpd.read_file(rws_input_filename)
+    rivm_data = read_geodataframe(rivm_input_filename)
+    rws_data = read_geodataframe(rws_input_filename)
 
     # Project data to WGS84 coordinate system
-    rivm_data.to_crs(crs="EPSG:4326", inplace=True)
-    rws_data.to_crs(crs="EPSG:4326", inplace=True)
+    rivm_data = reproject_to_wgs84(rivm_data)
+    rws_data = reproject_to_wgs84(rws_data)
 
     logger.info(f"Loaded {len(rivm_data)} RIVM wind turbines")
     logger.info(f"Loaded {len(rws_data)} RWS wind turbine/data entries")
@@ -97,75 +99,129 @@ def netherlands(
     logger.info(f"Found {len(rws_rivm_common)} common turbines in RIVM and RWS dataset")
 
     # Collect all rivm-unique turbines
-    turbines_rivm_unique = []
-    for _, row in rivm_unique.iterrows():
-        turbines_rivm_unique.append(datarow_to_turbine(row))
+    turbines_rivm_unique = [
+        datarow_to_turbine(row) for row in rivm_unique.to_dict("records")
+    ]
     logger.info(
         f"Collected {len(turbines_rivm_unique)} unique turbines from RIVM dataset "
         f"with {len(rivm_unique.index)} entries"
     )
 
-    # Collect all relevant rws-unique turbines
-    turbines_rws_unique = []
-    rivm_data_tree = None
-    for _, row in rws_unique.iterrows():
-        mask = (rws_data_removed["utm_x"] == row["utm_x"]) & (
-            rws_data_removed["utm_y"] == row["utm_y"]
-        )
-        # Drop 'turbines' that are located on exactly the same location as
-        # OSS, OHVS, monopile
-        if not mask.any():
-            turbine = datarow_to_turbine(row)
-
-            if (
-                turbine.diameter is None
-                or turbine.hub_height is None
-                or turbine.type is None
-            ):
-                logger.info(
-                    f"Turbine {turbine.name} has poor properties, try to enrich it"
-                )
-
-                nearest_turbine, dist, rivm_data_tree = get_nearest_turbine(
-                    rivm_data, turbine, tol=1, tree=rivm_data_tree
-                )
-
-                if nearest_turbine is not None:
-                    turbine_enriched = merge_turbine_data(
-                        row, nearest_turbine.iloc[0], merged_source_name=row["source"]
-                    )
-                    if (
-                        turbine_enriched.is_offshore
-                        and dist is not None
-                        and dist < 10 * turbine_enriched.diameter
-                    ):
-                        # Enrich turbine with properties from nearest_turbine
-                        # if it is in distance of 10*diameter
-                        logger.info(
-                            f"Enriched specs of {turbine.name} with a nearest turbine "
-                            f"with distance "
-                            f"{int(dist)}m < {int(10*turbine_enriched.diameter)}m"
-                        )
-                        turbine = turbine_enriched
-
-            turbines_rws_unique.append(turbine)
-        else:
-            logger.info(
-                f"Removed 'turbine' at location {row['geometry']}, "
-                f"utm_x={row['utm_x']}, utm_y={row['utm_y']} "
-                f"as it exactly is located on a removed item."
+    # Collect all relevant rws-unique turbines; drop 'turbines' that are located on
+    # exactly the same location as OSS, OHVS, monopile
+    removed_locations = set(
+        zip(rws_data_removed["utm_x"].to_numpy(), rws_data_removed["utm_y"].to_numpy())
+    )
+    on_removed_location = np.array(
+        [
+            location in removed_locations
+            for location in zip(
+                rws_unique["utm_x"].to_numpy(), rws_unique["utm_y"].to_numpy()
             )
+        ],
+        dtype=bool,
+    )
+    for row in rws_unique[on_removed_location].to_dict("records"):
+        logger.info(
+            f"Removed 'turbine' at location {row['geometry']}, "
+            f"utm_x={row['utm_x']}, utm_y={row['utm_y']} "
+            f"as it exactly is located on a removed item."
+        )
+
+    rws_rows = rws_unique[~on_removed_location].to_dict("records")
+    turbines_rws_unique = [datarow_to_turbine(row) for row in rws_rows]
+
+    poor_turbines = [
+        idx
+        for idx, turbine in enumerate(turbines_rws_unique)
+        if turbine.diameter is None or turbine.hub_height is None or turbine.type is None
+    ]
+    for idx in poor_turbines:
+        logger.info(
+            f"Turbine {turbines_rws_unique[idx].name} has poor properties, "
+            "try to enrich it"
+        )
+
+    enriched_turbines = enrich_from_nearest_turbines(
+        [turbines_rws_unique[idx] for idx in poor_turbines],
+        [rws_rows[idx] for idx in poor_turbines],
+        rivm_data,
+    )
+    for idx, turbine in zip(poor_turbines, enriched_turbines):
+        turbines_rws_unique[idx] = turbine
 
     logger.info(
         f"Collected {len(turbines_rws_unique)} unique relevant turbines "
         f"from RWS dataset with {len(rws_unique.index)} entries"
     )
 
-    # Combine lists of turbines
-    all_turbines = rws_rivm_common + turbines_rivm_unique + turbines_rws_unique
-    logger.info(f"Combined turbines to list with {len(all_turbines)} turbines")
+    # Combine the turbines in a DataFrame to dump to csv and/or geojson
+    frames = [
+        pd.DataFrame(turbines)
+        for turbines in (rws_rivm_common, turbines_rivm_unique, turbines_rws_unique)
+        if len(turbines) > 0
+    ]
+    data = pd.concat(frames, ignore_index=True) if len(frames) > 0 else pd.DataFrame()
+    logger.info(f"Combined turbines to dataframe with {len(data.index)} turbines")
 
-    # Create a DataFrame to dump to csv and/or geojson
-    data = pd.DataFrame(all_turbines)
     save_dataframe(data, output_filename)
     return data
+
+
+def enrich_from_nearest_turbines(
+    turbines: List[Turbine],
+    rows: List[dict],
+    reference_data: pd.DataFrame,
+    tol: float = 1,
+) -> List[Turbine]:
+    """Enrich turbines with the properties of their nearest turbine in reference_data.
+
+    The nearest turbines are searched with a single KDTree query for all turbines.
+    A turbine is only enriched when the enriched turbine is offshore and the
+    nearest turbine is within a distance of 10 times its rotor diameter.
+
+    Args:
+        turbines (list[Turbine]):         Turbines to enrich
+        rows (list[dict]):                Data rows from which turbines are derived
+        reference_data (pd.DataFrame):    Turbines to take the missing properties from
+        tol (float):                      Upper bound (in degrees) for nearest turbine
+
+    Returns:
+        List with (possibly enriched) turbines
+    """
+    turbines = list(turbines)
+    if len(turbines) == 0 or len(reference_data.index) == 0:
+        return turbines
+
+    tree = KDTree(get_lat_lon_matrix(reference_data))
+    points = np.array([[t.latitude, t.longitude] for t in turbines], dtype=float)
+    distances, nearest = tree.query(points, k=1, distance_upper_bound=tol)
+
+    matched = np.flatnonzero(distances < tol)
+    if len(matched) == 0:
+        return turbines
+
+    # Geodesic distances (in meters) between turbines and their nearest turbine
+    nearest_lat_lon = get_lat_lon_matrix(reference_data.iloc[nearest[matched]])
+    _, _, dists = Geod(ellps="WGS84").inv(
+        points[matched, 1],
+        points[matched, 0],
+        nearest_lat_lon[:, 1],
+        nearest_lat_lon[:, 0],
+    )
+
+    for idx, nearest_idx, dist in zip(matched, nearest[matched], dists):
+        row = rows[idx]
+        turbine_enriched = merge_turbine_data(
+            row, reference_data.iloc[nearest_idx], merged_source_name=row["source"]
+        )
+        if turbine_enriched.is_offshore and dist < 10 * turbine_enriched.diameter:
+            # Enrich turbine with properties from nearest turbine
+            # if it is in distance of 10*diameter
+            logger.info(
+                f"Enriched specs of {turbines[idx].name} with a nearest turbine "
+                f"with distance {int(dist)}m < {int(10*turbine_enriched.diameter)}m"
+            )
+            turbines[idx] = turbine_enriched
+
+    return turbines
@@ -9,9 +9,12 @@ from typing import Optional
 import geopandas as gpd
 import pandas as pd
 
+from ...io.readers import read_excel
 from ...io.writers import save_dataframe
 from ...logs import logger
 from ...turbine_utils import datarow_to_turbine
+from ..get_lat_lon_matrix import has_valid_lat_lon
+from ..reproject_to_wgs84 import reproject_to_wgs84
 
 
 def sweden(
@@ -30,7 +33,7 @@ def sweden(
         _, label_source = os.path.split(input_filename)
     logger.info(f"Set source-field for {input_filename} to '{label_source}'")
 
-    data = pd.read_excel(input_filename, sheet_name="Land - Vindkraftverk")
+    data = read_excel(input_filename, sheet_name="Land - Vindkraftverk")
 
     if "source" not in data:
         data["source"] = label_source
@@ -38,33 +41,26 @@ def sweden(
     if "country" not in data:
         data["country"] = "Sweden"
 
-    x = data["E-Koordinat"].to_numpy().tolist()
-    y = data["N-Koordinat"].to_numpy().tolist()
+    x = data["E-Koordinat"].to_numpy(dtype=float)
+    y = data["N-Koordinat"].to_numpy(dtype=float)
 
     geometry = gpd.points_from_xy(x, y, crs="EPSG:3006")
     geo_data = gpd.GeoDataFrame(data, geometry=geometry)
 
     # Project data to WGS84 coordinate system
-    geo_data.to_crs(crs="EPSG:4326", inplace=True)
+    geo_data = reproject_to_wgs84(geo_data)
 
     logger.debug(f"Loaded {len(geo_data.index)} turbines")
 
-    geo_data = geo_data[
-        (geo_data["Status"] == "Nedmonterat")
-        | (geo_data["Status"] == "Uppfört")
-        | (~pd.isna(geo_data["Uppfört"]))
-    ]
+    # Only keep real turbines with a valid location
+    is_real = (
+        geo_data["Status"].isin(["Nedmonterat", "Uppfört"]) | geo_data["Uppfört"].notna()
+    )
+    geo_data = geo_data.loc[is_real & has_valid_lat_lon(geo_data)]
 
     logger.debug(f"Loaded {len(geo_data.index)} real turbines")
 
-    turbines = []
-    for _, row in geo_data.iterrows():
-        turbine = datarow_to_turbine(row)
-        if (
-            turbine.latitude == turbine.latitude
-            and turbine.longitude == turbine.longitude
-        ):
-            turbines.append(turbine)
+    turbines = [datarow_to_turbine(row) for row in geo_data.to_dict("records")]
 
     data = pd.DataFrame(turbines)
     save_dataframe(data, output_filename)
@@ -5,10 +5,11 @@ from typing import Optional
 
 import pandas as pd
 
-from ...io.readers import parse_rules
+from ...io.readers import parse_rules, read_excel
 from ...io.writers import save_dataframe
 from ...logs import logger
 from ...turbine_utils import datarow_to_turbine
+from ..get_lat_lon_matrix import has_valid_lat_lon
 
 
 def thewindpower(
@@ -28,7 +29,7 @@ def thewindpower(
         _, label_source = os.path.split(input_filename)
     logger.info(f"Set source-field for {input_filename} to '{label_source}'")
 
-    data = pd.read_excel(
+    data = read_excel(
         input_filename, header=[0, 1], sheet_name="Windfarms", na_values="#ND"
     )
 
@@ -38,22 +39,16 @@ def thewindpower(
     # Apply rename rules
     data = data.rename(columns=parse_rules(rename_rules))
 
-    data = data[
-        (data["Status"] == "Production")
-        | ((data["Status"] == "Dismantled") & ~pd.isna(data["Decommissioning date"]))
-    ]
+    # Only keep (decommissioned) windfarms in production with a valid location
+    in_production = data["Status"].eq("Production") | (
+        data["Status"].eq("Dismantled") & data["Decommissioning date"].notna()
+    )
+    data = data.loc[in_production & has_valid_lat_lon(data)].copy()
 
     if "source" not in data:
         data["source"] = label_source
 
-    windfarms = []
-    for _, row in data.iterrows():
-        windfarm = datarow_to_turbine(row)
-        if (
-            windfarm.latitude == windfarm.latitude
-            and windfarm.longitude == windfarm.longitude
-        ):
-            windfarms.append(windfarm)
+    windfarms = [datarow_to_turbine(row) for row in data.to_dict("records")]
 
     data = pd.DataFrame(windfarms)
     save_dataframe(data, output_filename)
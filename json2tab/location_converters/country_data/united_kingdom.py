@@ -1,15 +1,35 @@
 """Converter to generate wind turbine location files for United Kingdom."""
 
-import math
 import os
 from typing import Optional
 
 import geopandas as gpd
 import pandas as pd
 
+from ...io.readers import read_excel
 from ...io.writers import save_dataframe
 from ...logs import logger
 from ...turbine_utils import datarow_to_turbine
+from ..get_lat_lon_matrix import has_valid_lat_lon
+from ..reproject_to_wgs84 import reproject_to_wgs84
+
+REPD_COLUMNS = [
+    "Technology Type",
+    "Development Status",
+    "X-coordinate",
+    "Y-coordinate",
+    "Operator (or Applicant)",
+    "Site Name",
+    "Installed Capacity (MWelec)",
+    "Turbine Capacity",
+    "No. of Turbines",
+    "Height of Turbines (m)",
+    "Operational",
+    "Ref ID",
+    "Record Last Updated (dd/mm/yyyy)",
+    "Country",
+]
+"""Columns of the Renewable Energy Planning Database used by the converter."""
 
 
 def united_kingdom(
@@ -28,25 +48,21 @@ def united_kingdom(
         _, label_source = os.path.split(input_filename)
     logger.info(f"Set source-field for {input_filename} to '{label_source}'")
 
-    data = pd.read_excel(input_filename, sheet_name="REPD")
+    data = read_excel(input_filename, sheet_name="REPD")
 
-    # Filter to only windfarms
-    data = data[
-        (data["Technology Type"] == "Wind Offshore")
-        | (data["Technology Type"] == "Wind Onshore")
-    ]
+    # Drop the (many) REPD columns that are not used, to save memory
+    data = data[[column for column in REPD_COLUMNS if column in data.columns]]
 
     # Filter to only operational and decommissioned windfarms
-    data = data[
-        (data["Development Status"] == "Operational")
-        | (data["Development Status"] == "Decommissioned")
-    ]
+    is_windfarm = data["Technology Type"].isin(["Wind Offshore", "Wind Onshore"])
+    is_built = data["Development Status"].isin(["Operational", "Decommissioned"])
+    data = data.loc[is_windfarm & is_built].copy()
 
     if "source" not in data:
         data["source"] = label_source
 
-    x = data["X-coordinate"].to_numpy().tolist()
-    y = data["Y-coordinate"].to_numpy().tolist()
+    x = data["X-coordinate"].to_numpy(dtype=float)
+    y = data["Y-coordinate"].to_numpy(dtype=float)
 
     # Derive is_offshore field from Technology Type
     data["is_offshore"] = data["Technology Type"] == "Wind Offshore"
@@ -55,7 +71,7 @@ def united_kingdom(
     geo_data = gpd.GeoDataFrame(data, geometry=geometry)
 
     # Project data to WGS84 coordinate system
-    geo_data.to_crs(crs="EPSG:4326", inplace=True)
+    geo_data = reproject_to_wgs84(geo_data)
 
     logger.debug(f"Loaded {len(geo_data.index)} turbines")
 
@@ -74,16 +90,10 @@ def united_kingdom(
 
     geo_data.loc[geo_data["Development Status"] == "Operational", "end_date"] = None
 
-    turbines = []
-    for _, row in geo_data.iterrows():
-        turbine = datarow_to_turbine(row)
-        if (
-            turbine.latitude == turbine.latitude
-            and turbine.longitude == turbine.longitude
-            and not math.isinf(turbine.latitude)
-            and not math.isinf(turbine.longitude)
-        ):
-            turbines.append(turbine)
+    # Only keep turbines with a valid location
+    geo_data = geo_data[has_valid_lat_lon(geo_data)]
+
+    turbines = [datarow_to_turbine(row) for row in geo_data.to_dict("records")]
 
     data = pd.DataFrame(turbines)
     save_dataframe(data, output_filename)
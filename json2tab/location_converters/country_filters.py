@@ -1,13 +1,24 @@
 """Module to select or remove wind turbines from a specific country (or countries)."""
 
+import itertools
+import os
 import shutil
-from typing import List
+from functools import partial
+from typing import Iterator, List
 
+import numpy as np
 import pandas as pd
 
-from ..io.readers import read_locationdata_as_dataframe
-from ..io.writers import save_dataframe
+from ..io.readers import (
+    read_locationdata_as_dataframe,
+    read_locationdata_from_csv_as_dataframe,
+)
+from ..io.writers import save_dataframe, save_dataframe_in_place
 from ..logs import logger
+from ..turbine_utils import categorize_static_columns
+
+CSV_CHUNKSIZE = 200_000
+"""Number of rows per chunk to stream large csv-files through the selection."""
 
 
 def select_from_countries(
@@ -29,9 +40,8 @@ def select_from_countries(
 
     logger.info(f"Selecting turbines in {', '.join(map(str, countries))}")
 
-    def selector(data):
-        return data["country"].isin(countries)
-
+    # Selector for (chunks of) data, with the requested countries prepared once
+    selector = partial(_in_countries, countries=pd.Index(countries).unique())
     return select_turbines(input_filename, output_filename, selector)
 
 
@@ -54,9 +64,8 @@ def remove_from_countries(
 
     logger.info(f"Selecting turbines not in {', '.join(map(str, countries))}")
 
-    def selector(data):
-        return ~data["country"].isin(countries)
-
+    # Selector for (chunks of) data, with the requested countries prepared once
+    selector = partial(_not_in_countries, countries=pd.Index(countries).unique())
     return select_turbines(input_filename, output_filename, selector)
 
 
@@ -73,7 +82,8 @@ def select_offshore(input_filename: str, output_filename: str) -> pd.DataFrame:
     logger.info("Selecting offshore wind turbines.")
 
     def selector(data):
-        return data["is_offshore"]
+        # Explicit comparison, so turbines with a missing is_offshore are not selected
+        return data["is_offshore"].eq(True).to_numpy(dtype=bool, na_value=False)
 
     return select_turbines(input_filename, output_filename, selector)
 
@@ -91,7 +101,8 @@ def select_onshore(input_filename: str, output_filename: str) -> pd.DataFrame:
     logger.info("Selecting onshore wind turbines.")
 
     def selector(data):
-        return ~data["is_offshore"]
+        # Explicit comparison, so turbines with a missing is_offshore are not selected
+        return data["is_offshore"].eq(False).to_numpy(dtype=bool, na_value=False)
 
     return select_turbines(input_filename, output_filename, selector)
 
@@ -102,27 +113,145 @@ def select_turbines(input_filename: str, output_filename: str, selector) -> pd.D
     Args:
         input_filename (str):        Input csv/geojson-file with turbine location data
         output_filename (str):       Output csv/geojson-file with selected turbine data
-        selector:                    Function to select turbines from data
+        selector:                    Function returning a boolean mask (array) of
+                                     the turbines to select from data
 
     Returns:
         pandas.DataFrame with wind turbines that are selected by the selector
     """
-    data = read_locationdata_as_dataframe(input_filename)
-
-    data_filtered = data[selector(data)]
+    if _is_csv(input_filename) and (output_filename is None or _is_csv(output_filename)):
+        # Stream large csv-files in chunks, so only the selected turbines are kept
+        chunks = read_locationdata_from_csv_as_dataframe(
+            input_filename, chunksize=CSV_CHUNKSIZE
+        )
+        first_chunks = list(itertools.islice(chunks, 2)) if chunks is not None else []
+        if len(first_chunks) > 1:
+            return _select_turbines_in_chunks(
+                itertools.chain(first_chunks, chunks),
+                input_filename,
+                output_filename,
+                selector,
+            )
+        data = categorize_static_columns(first_chunks[0]) if first_chunks else None
+    else:
+        data = read_locationdata_as_dataframe(input_filename, categorize=True)
+
+    if data is None:
+        logger.error(f"No turbine data read from {input_filename}; nothing selected")
+        return pd.DataFrame()
+
+    # Boolean mask as array, so filtering does not need to align on the index
+    selected = np.asarray(selector(data), dtype=bool)
+    if selected.all():
+        # Nothing to filter, so the input file is also the (selected) output
+        logger.info(f"Selected all {len(data.index)} turbines; no filtering needed")
+        if output_filename is None or _same_file(input_filename, output_filename):
+            # Keep a backup like the other in-place paths, the input stays as is
+            backup_input_filename = f"{input_filename}.orig"
+            shutil.copyfile(input_filename, backup_input_filename)
+            logger.info(
+                f"Copied original input-file {input_filename} to "
+                f"{backup_input_filename}, set output-file to {input_filename}"
+            )
+            return data
+
+        if _same_extension(input_filename, output_filename):
+            shutil.copyfile(input_filename, output_filename)
+            logger.info(f"Copied input-file {input_filename} to {output_filename}")
+            return data
+
+    data_filtered = data[selected]
 
     logger.info(f"Selected {len(data_filtered.index)} turbines")
 
     if output_filename is None:
-        backup_input_filename = f"{input_filename}.orig"
+        save_dataframe_in_place(data_filtered, input_filename)
+    else:
+        save_dataframe(data_filtered, output_filename)
 
-        shutil.copyfile(input_filename, backup_input_filename)
+    return data_filtered
+
+
+def _select_turbines_in_chunks(
+    chunks: Iterator[pd.DataFrame], input_filename: str, output_filename: str, selector
+) -> pd.DataFrame:
+    """Select wind turbines chunk by chunk and write them to a csv-file.
+
+    Args:
+        chunks:                 Iterator over chunks of the input data
+        input_filename (str):   Input csv-file with turbine location data
+        output_filename (str):  Output csv-file with selected turbine data;
+                                the input file is overwritten if None
+        selector:               Function to select turbines from data
+
+    Returns:
+        pandas.DataFrame with wind turbines that are selected by the selector
+    """
+    in_place = output_filename is None or _same_file(input_filename, output_filename)
+    if in_place:
+        # Write next to the input, as the input is still read while writing
+        input_filename_base, input_filename_ext = os.path.splitext(input_filename)
+        write_filename = f"{input_filename_base}.tmp{input_filename_ext}"
+    else:
+        write_filename = output_filename
+
+    selected_chunks = []
+    try:
+        for chunk in chunks:
+            chunk_filtered = chunk[np.asarray(selector(chunk), dtype=bool)]
+            save_dataframe(
+                chunk_filtered, write_filename, append=len(selected_chunks) > 0
+            )
+            selected_chunks.append(chunk_filtered)
+    except BaseException:
+        if in_place and os.path.exists(write_filename):
+            os.remove(write_filename)
+        raise
+
+    if in_place:
+        backup_input_filename = f"{input_filename}.orig"
+        os.replace(input_filename, backup_input_filename)
+        os.replace(write_filename, input_filename)
         logger.info(
-            f"Copied original input-file {input_filename} to {backup_input_filename}, "
+            f"Moved original input-file {input_filename} to {backup_input_filename}, "
             f"set output-file to {input_filename}"
         )
-        output_filename = input_filename
-
-    save_dataframe(data_filtered, output_filename)
 
+    # Categories differ per chunk, so categorize the concatenated chunks again
+    data_filtered = categorize_static_columns(pd.concat(selected_chunks))
+    logger.info(f"Selected {len(data_filtered.index)} turbines")
     return data_filtered
+
+
+def _is_csv(filename: str) -> bool:
+    """Checks if a file has a csv extension."""
+    _, ext = os.path.splitext(filename)
+    return ext.lower() == ".csv"
+
+
+def _in_countries(data: pd.DataFrame, countries: pd.Index) -> np.ndarray:
+    """Checks which turbines are located in one of the countries.
+
+    Compares the integer category codes of the country column instead of the
+    country strings; data itself is not modified.
+    """
+    country = data["country"].astype("category")
+    country_codes = country.cat.categories.get_indexer(countries)
+    return np.isin(country.cat.codes.to_numpy(), country_codes[country_codes >= 0])
+
+
+def _not_in_countries(data: pd.DataFrame, countries: pd.Index) -> np.ndarray:
+    """Checks which turbines are not located in one of the countries."""
+    return ~_in_countries(data, countries)
+
+
+def _same_file(filename1: str, filename2: str) -> bool:
+    """Checks if two filenames refer to the same path."""
+    return os.path.abspath(filename1) == os.path.abspath(filename2)
+
+
+def _same_extension(filename1: str, filename2: str) -> bool:
+    """Checks if two files have the same (case insensitive) extension."""
+    _, ext1 = os.path.splitext(filename1)
+    _, ext2 = os.path.splitext(filename2)
+    return ext1.lower() == ext2.lower()
@@ -1,15 +1,17 @@
 """Module with Fixer to derive country and is_offshore field for turbine locations."""
 
-import os
-import shutil
 from typing import List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ..io.readers import read_locationdata_as_dataframe
-from ..io.writers import save_dataframe
+from ..io.writers import save_dataframe, save_dataframe_in_place
 from ..logs import logger
-from ..tools.Location2CountryConverter import Location2CountryConverter
+from ..tools.Location2CountryConverter import (
+    Location2CountryConverter,
+    get_location2country_converter,
+)
 
 
 def fix_country_offshore(
@@ -26,16 +28,20 @@ def fix_country_offshore(
         update_country (bool):       Flag indicating to fix country
         update_is_offshore (bool):   Flag indicating to fix is_offshore flag
     """
-    eez_files = [filename for filename in input_filenames if "eez" in filename.lower()]
-
-    country_border_files = [
-        filename for filename in input_filenames if "country_border" in filename.lower()
-    ]
-
-    eez_file = eez_files[0] if len(eez_files) > 0 else None
-    land_file = country_border_files[0] if len(country_border_files) > 0 else None
-
-    input_files = list(set(input_filenames) - {eez_file, land_file})
+    # Partition filenames in the (first) EEZ, country border and input files
+    eez_file = None
+    land_file = None
+    input_files = []
+    for filename in input_filenames:
+        if filename in (eez_file, land_file) or filename in input_files:
+            continue
+
+        if eez_file is None and "eez" in filename.lower():
+            eez_file = filename
+        elif land_file is None and "country_border" in filename.lower():
+            land_file = filename
+        else:
+            input_files.append(filename)
 
     country_offshore_flag_fixer(
         input_files,
@@ -69,8 +75,10 @@ def country_offshore_flag_fixer(
     print(f" > Country EEZ-file: {eez_file}")
     print(f" > Country land border-file: {land_file}")
 
-    loc2eez = Location2CountryConverter(eez_file)
-    loc2land = Location2CountryConverter(land_file) if land_file is not None else None
+    loc2eez = get_location2country_converter(eez_file)
+    loc2land = (
+        get_location2country_converter(land_file) if land_file is not None else None
+    )
 
     data = None
     if isinstance(input_filename, str):
@@ -86,37 +94,28 @@ def country_offshore_flag_fixer(
         )
 
     for input_filename in input_filenames:
-        if input_filename is not None:
-            if output_filename is None or len(input_filenames) > 1:
-                input_filename_base, input_filename_ext = os.path.splitext(input_filename)
-                backup_input_filename = f"{input_filename_base}{input_filename_ext}.orig"
-
-                shutil.copyfile(input_filename, backup_input_filename)
-                logger.info(
-                    f"Copied original input-file {input_filename} to "
-                    f"{backup_input_filename}, set output-file to {input_filename}"
-                )
-                output_filename = input_filename
-            else:
-                backup_input_filename = None
-        # else: data is already set by direct feed-in
+        # Overwrite input file when no (unique) output file is given;
+        # data is already set by direct feed-in when input_filename is None
+        in_place = input_filename is not None and (
+            output_filename is None or len(input_filenames) > 1
+        )
+        if in_place:
+            output_filename = input_filename
 
         print(f"{prog_name} converts {input_filename} -> {output_filename}")
 
-        logger.debug(f"input filename: {backup_input_filename or input_filename}")
+        logger.debug(f"input filename: {input_filename}")
         logger.debug(f"output filename: {output_filename}")
 
         if input_filename is not None:
             data = read_locationdata_as_dataframe(input_filename)
 
         if data is not None:
-            new_is_offshore, new_country = zip(
-                *data.apply(
-                    lambda row: get_offshore_and_country(
-                        loc2eez, loc2land, lon=row["longitude"], lat=row["latitude"]
-                    ),
-                    axis=1,
-                )
+            new_is_offshore, new_country = get_offshore_and_countries(
+                loc2eez,
+                loc2land,
+                lon=data["longitude"].to_numpy(dtype=float),
+                lat=data["latitude"].to_numpy(dtype=float),
             )
 
             if update_country:
@@ -124,35 +123,38 @@ def country_offshore_flag_fixer(
             if update_is_offshore:
                 data["is_offshore"] = new_is_offshore
 
-            if output_filename is not None:
+            if in_place:
+                save_dataframe_in_place(data, output_filename)
+            elif output_filename is not None:
                 save_dataframe(data, output_filename)
 
     return data
 
 
-def get_offshore_and_country(
+def get_offshore_and_countries(
     location_to_eez: Location2CountryConverter,
     location_to_land: Location2CountryConverter,
-    lon: float,
-    lat: float,
-) -> Tuple[bool, float]:
-    """Computes country and is_offshore for a given lat/lon.
+    lon: np.ndarray,
+    lat: np.ndarray,
+) -> Tuple[Optional[np.ndarray], np.ndarray]:
+    """Computes countries and is_offshore flags for arrays of lat/lon coordinates.
 
     Args:
         location_to_eez (Location2CountryConverter):  Converter to derive EEZ country
         location_to_land (Location2CountryConverter): Converter to derive land country
-        lon (float):                                  The longitude of the point
-        lat (float):                                  The latitude of the point
+        lon (numpy.ndarray):                          The longitudes of the points
+        lat (numpy.ndarray):                          The latitudes of the points
 
     Returns:
-        is_offshore: Flag indicating if point is an offshore location
-        country:     The name of the country (EEZ based) of this location
+        is_offshore: Flags indicating if points are offshore locations
+                     (None if no land converter is provided)
+        country:     The names of the countries (EEZ based) of these locations
     """
-    country = location_to_eez.get_country(lon, lat)
+    country = location_to_eez.get_countries(lon, lat)
 
     if location_to_land is not None:
-        land = location_to_land.get_country(lon, lat)
-        is_offshore = country is not None and land is None
+        land = location_to_land.get_countries(lon, lat)
+        is_offshore = np.not_equal(country, None) & np.equal(land, None)
     else:
         is_offshore = None
 
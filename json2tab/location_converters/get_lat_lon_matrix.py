@@ -1,13 +1,10 @@
 """Module to get lat/lon coordinates for wind turbine location data convertion."""
 
+from typing import List, Optional
+
 import numpy as np
 import pandas as pd
 
-try:
-    import geopandas as gpd
-except ImportError:
-    gpd = None
-
 try:
     import shapely
 except ImportError:
@@ -15,6 +12,12 @@ except ImportError:
 
 from ..logs import logger
 
+LATITUDE_FIELDS = ["latitude", "lat", "Latitude", "N"]
+"""Data fields (in order of preference) containing the latitude of a turbine."""
+
+LONGITUDE_FIELDS = ["longitude", "lon", "Longitude", "E"]
+"""Data fields (in order of preference) containing the longitude of a turbine."""
+
 
 def get_lat_lon(turbine: dict):
     """Get lat/lon coordinates for a turbine.
@@ -55,53 +58,132 @@ def get_lat_lon_matrix(data: pd.DataFrame | dict, return_in_lat_lon_order: bool
     elif isinstance(data, dict):
         cols = data.keys()
 
+    # Set of columns for (hashed) lookups of the lat/lon fields
+    col_set = set(cols)
+
     # Get latitude data
     latitude = None
     longitude = None
 
-    if "geometry" in cols:
-        if isinstance(data["geometry"], str) and shapely is not None:
-            geo_data = data
-            geo_data["geometry"] = shapely.from_wkt(data["geometry"])
-        elif (
-            isinstance(data["geometry"], pd.Series)
-            and isinstance(data["geometry"].iloc[0], str)
-            and gpd is not None
-        ):
-            geometry = gpd.GeoSeries.from_wkt(data["geometry"])
-            geo_data = gpd.GeoDataFrame(data, geometry=geometry)
-        else:
-            geo_data = data
-
-        try:
-            longitude = geo_data["geometry"].x
-            latitude = geo_data["geometry"].y
-        except AttributeError:
-            longitude = None
-            latitude = None
+    if "geometry" in col_set and shapely is not None:
+        geometry = _get_point_geometry(data)
+        if geometry is not None:
+            longitude = shapely.get_x(geometry)
+            latitude = shapely.get_y(geometry)
 
     if latitude is None:
-        lat_fields = ["latitude", "lat", "Latitude", "N"]
-        for field in lat_fields:
-            if field in cols:
-                latitude = get_values(data[field])
-                break
+        latitude_field = _find_field(col_set, LATITUDE_FIELDS)
+        if latitude_field is not None:
+            latitude = get_values(data[latitude_field])
 
     if latitude is None:
         logger.error(f"Cannot find latitude-data in {cols}")
 
     # Get longitude data
     if longitude is None:
-        lon_fields = ["longitude", "lon", "Longitude", "E"]
-        for field in lon_fields:
-            if field in cols:
-                longitude = get_values(data[field])
-                break
+        longitude_field = _find_field(col_set, LONGITUDE_FIELDS)
+        if longitude_field is not None:
+            longitude = get_values(data[longitude_field])
 
     if longitude is None:
         logger.error(f"Cannot find longitude-data in {cols}")
 
+    if isinstance(latitude, list) and isinstance(longitude, list):
+        # Fill a preallocated matrix directly from lists (e.g. a dict of lists)
+        lat_lon = _lists_to_matrix(latitude, longitude, return_in_lat_lon_order)
+        if lat_lon is not None:
+            return lat_lon
+
+    # Stack the (contiguous) columns and transpose, instead of interleaving them
     if return_in_lat_lon_order:
-        return np.column_stack((latitude, longitude))
+        return np.vstack((latitude, longitude)).T
+
+    return np.vstack((longitude, latitude)).T
+
+
+def _lists_to_matrix(
+    latitude: list, longitude: list, return_in_lat_lon_order: bool
+) -> Optional[np.ndarray]:
+    """Get float matrix with lat/lon columns from lists, if the values are numeric."""
+    if len(latitude) != len(longitude):
+        return None
+
+    lat_lon = np.empty((len(latitude), 2), dtype=np.float64)
+    lat_column = 0 if return_in_lat_lon_order else 1
+    try:
+        lat_lon[:, lat_column] = latitude
+        lat_lon[:, 1 - lat_column] = longitude
+    except (TypeError, ValueError):
+        return None
+
+    return lat_lon
+
+
+def _get_point_geometry(data: pd.DataFrame | dict):
+    """Get the (point) geometry of data as shapely geometry (array), if available.
+
+    Geometries given as wkt-strings are parsed; for a single turbine (dict) the
+    parsed geometry is also stored in data.
+    """
+    geometry = data["geometry"]
+
+    if isinstance(geometry, pd.Series):
+        if geometry.dtype.name == "geometry":
+            # Geometries of a GeoSeries
+            return geometry.to_numpy()
 
-    return np.column_stack((longitude, latitude))
+        if geometry.dtype != object:
+            # Numeric (e.g. all missing) geometries cannot be strings or shapes
+            return None
+
+        # Sniff the type of the geometries from the first value of the array
+        values = geometry.to_numpy()
+        if len(values) == 0:
+            return values
+
+        if isinstance(values[0], str):
+            # Parse the wkt-strings as array, without building a GeoDataFrame
+            return shapely.from_wkt(np.where(pd.isna(values), None, values))
+
+        if isinstance(values[0], shapely.Geometry):
+            return values
+
+        return None
+
+    if isinstance(geometry, str):
+        geometry = shapely.from_wkt(geometry)
+        data["geometry"] = geometry
+
+    if isinstance(geometry, shapely.Point):
+        return geometry
+
+    return None
+
+
+def _find_field(col_set: set, fields: List[str]) -> Optional[str]:
+    """Get the first of the fields (in order of preference) that is in col_set."""
+    return next((field for field in fields if field in col_set), None)
+
+
+def has_valid_lat_lon(data: pd.DataFrame) -> np.ndarray:
+    """Get mask of turbines in data with a valid (finite) lat/lon location.
+
+    Args:
+        data: DataFrame containing wind turbine data
+
+    Returns:
+        boolean array which is True for turbines with finite lat and lon
+
+    """
+    if len(data.index) == 0:
+        return np.zeros(0, dtype=bool)
+
+    lat_lon = get_lat_lon_matrix(data)
+    if lat_lon.dtype == object:
+        lat_lon = (
+            pd.DataFrame(lat_lon)
+            .apply(pd.to_numeric, errors="coerce")
+            .to_numpy(dtype=float)
+        )
+
+    return np.isfinite(lat_lon).all(axis=1)
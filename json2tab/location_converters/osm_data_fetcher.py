@@ -2,14 +2,22 @@
 
 import contextlib
 import json
+import logging
+import mmap
 import os
 import re
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     import requests
 except ImportError:
     requests = None
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -18,8 +26,38 @@ from ..io.writers import save_dataframe
 from ..location_converters.overpass_query_builder import build_query
 from ..logs import logger
 from ..Turbine import Turbine
+from ..turbine_utils import categorize_static_columns
 from ..utils import power_to_kw, print_processing_status
 
+PARSE_CACHE_SIZE = 4096
+"""Number of parsed OSM tag values (e.g. lengths and powers) to cache."""
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+"""Number of bytes per chunk to stream the Overpass API response to the dump file."""
+
+CATEGORICAL_COLUMNS = (
+    "manufacturer",
+    "type",
+    "operator",
+    "wind_farm",
+    "source",
+)
+"""Turbine columns with few distinct values, which are stored as category."""
+
+OFFSHORE_TAG_VALUES = {"yes": True, "no": False}
+"""Values of the OSM offshore tag and their is_offshore flag."""
+
+LENGTH_PATTERN = re.compile(r"(?P<length>\d+(\.\d+)?)\s*(m)?", re.IGNORECASE)
+"""Pattern to parse a length (in meter) from an OSM tag value."""
+
+N_TURBINES_PATTERN = re.compile(r"(?P<n_turbines>\d+)\s?\w*", re.IGNORECASE)
+"""Pattern to parse a number of turbines from an OSM tag value."""
+
+POWER_PATTERN = re.compile(
+    r"(?P<power>\d+(\.\d+)?)\s*(?P<unit>(kW)|(MW))?", re.IGNORECASE
+)
+"""Pattern to parse a power and its (optional) unit from an OSM tag value."""
+
 
 def osm_data_fetcher(
     output_filename: str,
@@ -65,15 +103,13 @@ def osm_data_fetcher(
                 logger.debug(
                     f"Process inputfile '{input_filename}' as Overpass API results"
                 )
-                with open(input_filename, "r") as input_file:
-                    data = json.load(input_file)
+                data = load_overpass_output(input_filename)
 
             if data is None and os.path.exists(overpass_dump_file):
                 logger.debug(
                     f"Process dumpfile '{overpass_dump_file}' as Overpass API results"
                 )
-                with open(overpass_dump_file, "r") as input_file:
-                    data = json.load(input_file)
+                data = load_overpass_output(overpass_dump_file)
 
             if not data:
                 # Overpass API URL
@@ -88,15 +124,34 @@ def osm_data_fetcher(
 
                 print("Executing request to fetch OSM data...")
 
-                response = requests.get(overpass_url, params={"data": overpass_query})
-                data = response.json()
-
-                # Dump overpass api response data to file
-                with open(overpass_dump_file, "w") as dump_file:
-                    json.dump(data, dump_file, indent=2)
-                    logger.debug(
-                        f"Dumped overpass query output to '{overpass_dump_file}'"
-                    )
+                # Stream overpass api response data to a temporary file, which only
+                # replaces the dump file once the download is complete
+                download_file = f"{overpass_dump_file}.part"
+                try:
+                    with requests.get(
+                        overpass_url, params={"data": overpass_query}, stream=True
+                    ) as response:
+                        response.raise_for_status()
+
+                        with open(download_file, "wb") as dump_file:
+                            for chunk in response.iter_content(
+                                chunk_size=DOWNLOAD_CHUNK_SIZE
+                            ):
+                                dump_file.write(chunk)
+                    os.replace(download_file, overpass_dump_file)
+                except BaseException:
+                    # Do not keep a partial response (e.g. interrupted download)
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(download_file)
+                    raise
+                logger.debug(f"Dumped overpass query output to '{overpass_dump_file}'")
+
+                try:
+                    data = load_overpass_output(overpass_dump_file)
+                except json.JSONDecodeError:
+                    # Do not keep an invalid response as cached overpass output
+                    os.remove(overpass_dump_file)
+                    raise
 
                 print("... got response for query")
 
@@ -111,31 +166,33 @@ def osm_data_fetcher(
             logger.info(f"Received {len(data['elements'])} elements")
 
             osm_types = ["relation", "node", "way"]
-            elements = {}
+            elements = {osm_type: [] for osm_type in osm_types}
+            elements["node_wo_tags"] = []
+
+            # Group the elements by osm_type in a single pass over all elements
+            for nwr in data["elements"]:
+                osm_type = nwr["type"]
+                if osm_type in osm_types:
+                    elements[osm_type].append(nwr)
+                    if osm_type == "node" and nwr.get("tags") is None:
+                        elements["node_wo_tags"].append(nwr)
 
             for osm_type in osm_types:
-                elements[osm_type] = [
-                    nwr for nwr in data["elements"] if nwr["type"] == osm_type
-                ]
                 logger.info(f"Found {len(elements[osm_type])} {osm_type}s in data")
-
-            elements["node_wo_tags"] = [
-                n for n in elements["node"] if n.get("tags") is None
-            ]
             logger.info(f"Found {len(elements['node_wo_tags'])} nodes w/o tags in data")
 
             # Process each element, grouped by osm_type
             for osm_type in osm_types:
                 logger.info(f"Start processing osm type {osm_type}")
 
+                # Format the status label (and count) once per osm_type
+                status_label = f"Processing OSM elements of type {osm_type}"
+                n_elements = len(elements[osm_type])
+
                 element_counter = 0
                 for element in elements[osm_type]:
                     element_counter += 1
-                    print_processing_status(
-                        element_counter,
-                        len(elements[osm_type]),
-                        f"Processing OSM elements of type {osm_type}",
-                    )
+                    print_processing_status(element_counter, n_elements, status_label)
 
                     if element.get("tags") is None:
                         if element.get("windturbine_via_wf"):
@@ -144,19 +201,23 @@ def osm_data_fetcher(
                             # Skip elements without tags
                             continue
 
+                    # Look up the tags (and windturbine tagging) once per element
+                    tags = element["tags"]
+                    element_is_windturbine = is_windturbine(element)
+
                     # Basic turbine information
                     osm_id = get_osm_id(element)
                     name = get_osm_name(element)
 
                     # Parse manufacturer and turbine type model
-                    manufacturer = element["tags"].get("manufacturer")
+                    manufacturer = tags.get("manufacturer")
                     model_type = get_model_type_from_element(element)
 
                     # Parse wind turbine specs
                     hub_height = get_hub_height_from_element(element)
-                    rotor_diameter = parse_length(element["tags"].get("rotor:diameter"))
+                    rotor_diameter = parse_length(tags.get("rotor:diameter"))
                     rated_power = parse_power_to_kw(
-                        element["tags"].get("generator:output:electricity")
+                        tags.get("generator:output:electricity")
                     )
 
                     if isinstance(rotor_diameter, str):
@@ -167,10 +228,10 @@ def osm_data_fetcher(
                         rotor_diameter = None
 
                     # Parse some additional optional information
-                    operator = element["tags"].get("operator")
-                    start_date = element["tags"].get("start_date")
-                    site = element["tags"].get("site")
-                    is_offshore = element["tags"].get("offshore")
+                    operator = tags.get("operator")
+                    start_date = tags.get("start_date")
+                    site = tags.get("site")
+                    is_offshore = tags.get("offshore")
 
                     # Read more data from linked wind_farm
                     windfarm_osm_id = element.get("windfarm_osm_id")
@@ -217,15 +278,15 @@ def osm_data_fetcher(
                         source="OSM",
                     )
 
-                    if is_windturbine(element) and element["type"] == "relation":
+                    if element_is_windturbine and osm_type == "relation":
                         # Don't trust this element as windturbine, process as windfarm
                         windfarm = process_wf_info(turbine.to_dict(), element, elements)
 
                         # Append to the windfarm list
                         windfarms.append(windfarm)
 
-                    elif is_windturbine(element) or element.get("windturbine_via_wf"):
-                        if not is_windturbine(element):
+                    elif element_is_windturbine or element.get("windturbine_via_wf"):
+                        if not element_is_windturbine:
                             logger.info(
                                 f"Interpreted node '{turbine.name}' ({osm_id}) "
                                 "as windturbine due to its wind_turbine "
@@ -241,8 +302,8 @@ def osm_data_fetcher(
                         turbines.append(turbine)
 
                     elif (
-                        element["tags"].get("power") == "plant"
-                        and element["tags"].get("plant:source") == "wind"
+                        tags.get("power") == "plant"
+                        and tags.get("plant:source") == "wind"
                     ):
                         # Parse windfarm information
                         windfarm = process_wf_info(turbine.to_dict(), element, elements)
@@ -250,14 +311,29 @@ def osm_data_fetcher(
                         # Append to the windfarm list
                         windfarms.append(windfarm)
 
-            # Create a DataFrame with turbines
-            df_turbines = pd.DataFrame(turbines)
+            # Create a DataFrame with turbines, column by column
+            turbine_keys = list(Turbine().to_dict())
+            df_turbines = pd.DataFrame(
+                {
+                    key: [getattr(turbine, key) for turbine in turbines]
+                    for key in turbine_keys
+                },
+                columns=turbine_keys,
+            )
+            df_turbines["is_offshore"] = parse_offshore_tags(df_turbines["is_offshore"])
+            df_turbines = categorize_static_columns(
+                df_turbines, columns=CATEGORICAL_COLUMNS
+            )
             logger.info(f"Generated dataframe with {len(df_turbines.index)} turbines")
             if len(df_turbines.index) > 0:
                 save_dataframe(df_turbines, output_filename_turbine)
 
             if len(windfarms) > 0 or query_windfarm:
                 df_windfarms = pd.DataFrame(windfarms)
+                if "is_offshore" in df_windfarms.columns:
+                    df_windfarms["is_offshore"] = parse_offshore_tags(
+                        df_windfarms["is_offshore"]
+                    )
                 logger.info(
                     f"Generated dataframe with {len(df_windfarms.index)} "
                     f"windfarms with "
@@ -286,6 +362,48 @@ def osm_data_fetcher(
     return None
 
 
+def load_overpass_output(filename: str) -> dict:
+    """Loads (dumped) Overpass API results from a json-file.
+
+    Uses the faster orjson parser if available, with json as fallback. With orjson
+    the file is memory mapped, so it is parsed without copying it into a buffer.
+    """
+    if orjson is not None:
+        with open(filename, "rb") as input_file:
+            if os.fstat(input_file.fileno()).st_size == 0:
+                # Empty files cannot be mapped; let orjson raise its decode error
+                return orjson.loads(b"")
+
+            with mmap.mmap(
+                input_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped_file, memoryview(mapped_file) as buffer:
+                return orjson.loads(buffer)
+
+    with open(filename, "r") as input_file:
+        return json.load(input_file)
+
+
+def parse_offshore_tags(offshore_tags: pd.Series) -> pd.Series:
+    """Parses OSM offshore tags ("yes"/"no") to a (nullable) boolean is_offshore.
+
+    Args:
+        offshore_tags (pandas.Series): Values of the OSM offshore tag
+
+    Returns:
+        pandas.Series with is_offshore flags; NA for missing or unknown tag values
+    """
+    is_offshore = offshore_tags.map(OFFSHORE_TAG_VALUES).astype("boolean")
+
+    unknown = offshore_tags.notna() & is_offshore.isna()
+    if unknown.any():
+        logger.warning(
+            f"Ignored {int(unknown.sum())} unknown offshore tag values: "
+            f"{', '.join(map(repr, offshore_tags[unknown].unique()))}"
+        )
+
+    return is_offshore
+
+
 def process_wf_info(windfarm, element, elements):
     """Process windfarm info from osm element."""
     n_turbines = parse_turbines_from_str(element["tags"].get("seamark:information"))
@@ -306,26 +424,26 @@ def process_wf_info(windfarm, element, elements):
 
     if element["type"] == "relation":
         if is_windturbine(element):
-            node_ids = [mbr["ref"] for mbr in element["members"] if mbr["type"] == "node"]
-            way_ids = [mbr["ref"] for mbr in element["members"] if mbr["type"] == "way"]
-            wf_turbines = [n for n in elements["node"] if n["id"] in set(node_ids)] + [
-                w for w in elements["way"] if w["id"] in set(way_ids)
-            ]
+            node_ids = {mbr["ref"] for mbr in element["members"] if mbr["type"] == "node"}
+            way_ids = {mbr["ref"] for mbr in element["members"] if mbr["type"] == "way"}
+            wf_nodes = get_elements_by_ids(elements, "node", node_ids)
+            wf_ways = get_elements_by_ids(elements, "way", way_ids)
+            wf_turbines = wf_nodes + wf_ways
         else:
-            wf_ids = [
+            wf_ids = {
                 mbr["ref"]
                 for mbr in element["members"]
                 if mbr["type"] == "node" and mbr["role"] in ["generator", "wind_turbine"]
-            ]
-            mbr_ids = [
+            }
+            mbr_ids = {
                 mbr["ref"]
                 for mbr in element["members"]
                 if mbr["type"] == "node" and mbr["role"] in ["", "inner", "node"]
-            ]
+            }
             wf_turbines = [
                 n
-                for n in elements["node"]
-                if n["id"] in set(mbr_ids) and is_windturbine(n) or n["id"] in set(wf_ids)
+                for n in get_elements_by_ids(elements, "node", mbr_ids | wf_ids)
+                if n["id"] in wf_ids or is_windturbine(n)
             ]
 
         n_turbines = len(wf_turbines)
@@ -425,8 +543,9 @@ def get_osm_id(element) -> str:
 
 def get_osm_name(element) -> str:
     """Gets name from OSM element."""
-    name = element["tags"].get("name")
-    alt_name = element["tags"].get("alt_name")
+    tags = element["tags"]
+    name = tags.get("name")
+    alt_name = tags.get("alt_name")
 
     if alt_name is not None:
         if str(alt_name).lower().startswith(str(name).lower()):
@@ -454,28 +573,30 @@ def get_lat_lon_from_element(element, elements) -> Tuple[float, float]:
 def get_model_type_from_element(element) -> str:
     """Gets model_type from osm element."""
     # Parse turbine type model
-    model_type = element["tags"].get("model")
+    tags = element["tags"]
+    model_type = tags.get("model")
 
     if model_type in [None, ""]:
         # Note manufacturer:type is deprecated
-        model_type = element["tags"].get("manufacturer:type")
+        model_type = tags.get("manufacturer:type")
 
     if model_type in [None, ""]:
-        model_type = element["tags"].get("generator:model")
+        model_type = tags.get("generator:model")
 
     return model_type
 
 
 def get_hub_height_from_element(element) -> float:
     """Gets hub height from osm element."""
-    hub_height = parse_length(element["tags"].get("height:hub"))
+    tags = element["tags"]
+    hub_height = parse_length(tags.get("height:hub"))
     if hub_height in [None, "", 0]:
         # est_hub:height is estimated hub:height
-        hub_height = parse_length(element["tags"].get("est_height:hub"))
+        hub_height = parse_length(tags.get("est_height:hub"))
 
     if hub_height in [None, "", 0]:
         # Use height as fallback to get hub height information of turbine
-        hub_height = parse_length(element["tags"].get("height"))
+        hub_height = parse_length(tags.get("height"))
 
     return hub_height
 
@@ -491,28 +612,63 @@ def get_lat_lon_from_node(node) -> Tuple[float, float]:
 def get_lat_lon_from_way(way, elements) -> Tuple[float, float]:
     """Gets lat/lon from OSM way."""
     # Fix lat/lon of way by taking the average of the lat/lons of nodes
-    nodes = [n for n in elements["node_wo_tags"] if n["id"] in set(way["nodes"])]
-    if len(nodes) != len(set(way["nodes"])):
-        nodes = [n for n in elements["node"] if n["id"] in set(way["nodes"])]
+    nodes = get_elements_by_ids(elements, "node", way["nodes"])
+
+    lat, lon = get_mean_lat_lon([get_lat_lon_from_node(node) for node in nodes])
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Defined lat/lon coordinates for {get_osm_id(way)} "
+            f"based on {len(nodes)} nodes; lat={lat}, lon={lon}"
+        )
+
+    return lat, lon
 
-    lat_lon = [get_lat_lon_from_node(node) for node in nodes]
 
-    lat = sum(lat for lat, lon in lat_lon) / len(nodes) if len(nodes) > 0 else None
-    lon = sum(lon for lat, lon in lat_lon) / len(nodes) if len(nodes) > 0 else None
+def get_element_index(elements, osm_type) -> Dict[int, List[int]]:
+    """Get index with the positions of the osm elements of osm_type per id.
 
-    logger.debug(
-        f"Defined lat/lon coordinates for {get_osm_id(way)} "
-        f"based on {len(nodes)} nodes; lat={lat}, lon={lon}"
+    The index is built once per osm_type and cached in the elements libary.
+    """
+    index_key = f"{osm_type}_index"
+    if index_key not in elements:
+        elements[index_key] = {}
+        for position, nwr in enumerate(elements[osm_type]):
+            elements[index_key].setdefault(nwr["id"], []).append(position)
+
+    return elements[index_key]
+
+
+def get_elements_by_ids(elements, osm_type, element_ids) -> List[dict]:
+    """Get osm elements (in data order) from elements libary by their ids.
+
+    The positions of the elements per id are indexed once per osm_type, so the
+    elements are looked up instead of scanning all elements of osm_type.
+    """
+    index = get_element_index(elements, osm_type)
+    positions = sorted(
+        position
+        for element_id in set(element_ids)
+        for position in index.get(element_id, [])
     )
+    return [elements[osm_type][position] for position in positions]
 
-    return lat, lon
+
+def get_mean_lat_lon(lat_lon: List[Tuple[float, float]]) -> Tuple[float, float]:
+    """Gets the mean lat/lon of a list of lat/lon coordinates."""
+    if len(lat_lon) == 0:
+        return None, None
+
+    # Split lat/lon in one pass; plain sums, as the lists are short
+    lats, lons = zip(*lat_lon)
+    return sum(lats) / len(lat_lon), sum(lons) / len(lat_lon)
 
 
 def get_element_by_id(elements, osm_type, elemet_id):
-    """Get osm element from elements libary by id."""
-    result = [nwr for nwr in elements[osm_type] if nwr["id"] == elemet_id]
-    if len(result) > 0:
-        return result[0]
+    """Get (first) osm element from elements libary by id."""
+    positions = get_element_index(elements, osm_type).get(elemet_id)
+    if positions:
+        return elements[osm_type][positions[0]]
 
     return None
 
@@ -520,34 +676,34 @@ def get_element_by_id(elements, osm_type, elemet_id):
 def get_lat_lon_from_relation(relation, elements) -> Tuple[float, float]:
     """Gets lat/lon from OSM relation."""
     # Fix lat/lon of relation by taking the average of the lat/lons of members
-    way_ids = [mbr["ref"] for mbr in relation["members"] if mbr["type"] == "way"]
-    node_ids = [mbr["ref"] for mbr in relation["members"] if mbr["type"] == "node"]
+    way_ids = {mbr["ref"] for mbr in relation["members"] if mbr["type"] == "way"}
+    node_ids = {mbr["ref"] for mbr in relation["members"] if mbr["type"] == "node"}
 
-    ways = [w for w in elements["way"] if w["id"] in set(way_ids)]
-    nodes = [n for n in elements["node"] if n["id"] in set(node_ids)]
+    ways = get_elements_by_ids(elements, "way", way_ids)
+    nodes = get_elements_by_ids(elements, "node", node_ids)
     members = ways + nodes
 
-    lat_lon = [get_lat_lon_from_element(mbr, elements) for mbr in members]
-    lat = sum(lat for lat, lon in lat_lon) / len(members) if len(members) > 0 else None
-    lon = sum(lon for lat, lon in lat_lon) / len(members) if len(members) > 0 else None
-
-    logger.debug(
-        f"Defined lat/lon coordinates for {get_osm_id(relation)} "
-        f"based on {len(members)} members; lat={lat}, lon={lon}"
+    lat, lon = get_mean_lat_lon(
+        [get_lat_lon_from_element(mbr, elements) for mbr in members]
     )
 
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"Defined lat/lon coordinates for {get_osm_id(relation)} "
+            f"based on {len(members)} members; lat={lat}, lon={lon}"
+        )
+
     return lat, lon
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_length(length_str: str):
     """Try to convert length string to distance in meter."""
     if length_str is None:
         return None
 
     # Try kW match
-    match = re.search(
-        r"(?P<length>\d+(\.\d+)?)\s*(m)?", length_str.replace(",", "."), re.IGNORECASE
-    )
+    match = LENGTH_PATTERN.search(length_str.replace(",", "."))
     if match:
         with contextlib.suppress(Exception):
             length = float(match.group("length"))
@@ -561,13 +717,11 @@ def parse_length(length_str: str):
 
 def is_windturbine(node) -> bool:
     """Check if an OSM node is a wind turbine."""
-    if "tags" in node:
-        return (
-            node["tags"].get("power") == "generator"
-            and node["tags"].get("generator:source") == "wind"
-        )
+    tags = node.get("tags")
+    if tags is None:
+        return False
 
-    return False
+    return tags.get("power") == "generator" and tags.get("generator:source") == "wind"
 
 
 def parse_turbines_from_str(turbine_str: str):
@@ -575,7 +729,7 @@ def parse_turbines_from_str(turbine_str: str):
     if turbine_str is None:
         return None
 
-    match = re.search(r"(?P<n_turbines>\d+)\s?\w*", turbine_str, re.IGNORECASE)
+    match = N_TURBINES_PATTERN.search(turbine_str)
     if match:
         with contextlib.suppress(Exception):
             return int(match.group("n_turbines"))
@@ -583,6 +737,7 @@ def parse_turbines_from_str(turbine_str: str):
     return turbine_str
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_power_to_kw(
     power_str: str,
     unit_fallback: Optional[str] = None,
@@ -594,11 +749,7 @@ def parse_power_to_kw(
         return None
 
     # Try to match power and unit
-    match = re.search(
-        r"(?P<power>\d+(\.\d+)?)\s*(?P<unit>(kW)|(MW))?",
-        power_str.replace(",", "."),
-        re.IGNORECASE,
-    )
+    match = POWER_PATTERN.search(power_str.replace(",", "."))
     if match:
         try:
             power = float(match.group("power"))
@@ -44,25 +44,25 @@ def build_query(
         requested_date = f'[date:"{requested_date}"]'
 
     # Header
-    query = f"[out:json]{requested_date};"
+    query_lines = [f"[out:json]{requested_date};"]
 
     if windturbine and windfarm:
-        query += "\n("
+        query_lines.append("(")
 
     if windturbine:
-        query += "\n"
-        query += f'nwr["power"="generator"]["generator:source"="wind"]{area_limit};'
+        query_lines.append(
+            f'nwr["power"="generator"]["generator:source"="wind"]{area_limit};'
+        )
 
     if windfarm:
-        query += "\n"
-        query += f'nwr["power"="plant"]["plant:source"="wind"]{area_limit};'
+        query_lines.append(f'nwr["power"="plant"]["plant:source"="wind"]{area_limit};')
 
     if windturbine and windfarm:
-        query += "\n);"
+        query_lines.append(");")
 
     # Footer
     # Get also the turbines marked as way (i.e. a list of grouped nodes)
-    query += "\n(._;>;);"
-    query += "\nout body;"
+    query_lines.append("(._;>;);")
+    query_lines.append("out body;")
 
-    return query
+    return "\n".join(query_lines)
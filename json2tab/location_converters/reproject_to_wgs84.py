@@ -0,0 +1,87 @@
+"""Module to reproject wind turbine location data to the WGS84 coordinate system."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import geopandas as gpd
+import numpy as np
+import shapely
+from pyproj import Transformer
+
+from ..logs import logger
+
+WGS84 = "EPSG:4326"
+
+MIN_COORDINATES_PER_THREAD = 50_000
+"""Minimal number of coordinates per thread to transform coordinates in parallel."""
+
+
+def reproject_to_wgs84(
+    data: gpd.GeoDataFrame, max_workers: Optional[int] = None
+) -> gpd.GeoDataFrame:
+    """Reprojects a GeoDataFrame to the WGS84 (EPSG:4326) coordinate system.
+
+    Equivalent to `data.to_crs("EPSG:4326")` (including the z-coordinates of 3D
+    geometries), but transforms the coordinates of all geometries as one contiguous
+    array, split in chunks over multiple threads for large datasets (PROJ releases
+    the GIL while transforming).
+
+    Args:
+        data (geopandas.GeoDataFrame): Data with geometries in a projected crs
+        max_workers (int):             (Optional) Maximal number of threads to use
+
+    Returns:
+        geopandas.GeoDataFrame with geometries in WGS84 coordinate system
+    """
+    if data.crs is None or data.crs == WGS84:
+        # Let geopandas handle (and complain about) data without or with the same crs
+        return data.to_crs(crs=WGS84)
+
+    geometries = data.geometry.to_numpy().copy()
+    include_z = bool(shapely.has_z(geometries).any())
+    coordinates = shapely.get_coordinates(geometries, include_z=include_z)
+
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1)
+    n_chunks = max(1, min(max_workers, len(coordinates) // MIN_COORDINATES_PER_THREAD))
+
+    if n_chunks > 1:
+        logger.debug(f"Reproject {len(coordinates)} coordinates using {n_chunks} threads")
+        chunks = np.array_split(coordinates, n_chunks)
+        with ThreadPoolExecutor(max_workers=n_chunks) as executor:
+            transformed = list(
+                executor.map(lambda chunk: _transform(data.crs, chunk), chunks)
+            )
+        coordinates = np.concatenate(transformed)
+    else:
+        coordinates = _transform(data.crs, coordinates)
+
+    geometries = shapely.set_coordinates(geometries, coordinates)
+    return data.set_geometry(gpd.GeoSeries(geometries, index=data.index, crs=WGS84))
+
+
+def _transform(crs, coordinates: np.ndarray) -> np.ndarray:
+    """Transforms an (N, 2) or (N, 3) array of coordinates from crs to WGS84.
+
+    Coordinates are in lon/lat order; a NaN z-coordinate marks a 2D coordinate
+    (as returned by `shapely.get_coordinates` for mixed 2D/3D geometries).
+    """
+    # Transformers are not thread safe, so create one per call
+    transformer = Transformer.from_crs(crs, WGS84, always_xy=True)
+    if coordinates.shape[1] == 2:
+        x, y = transformer.transform(coordinates[:, 0], coordinates[:, 1])
+        return np.column_stack((x, y))
+
+    # A NaN z-coordinate would also turn x/y into NaN, so transform 2D
+    # coordinates without z
+    transformed = coordinates.copy()
+    has_z = ~np.isnan(coordinates[:, 2])
+    x, y = transformer.transform(coordinates[~has_z, 0], coordinates[~has_z, 1])
+    transformed[~has_z, 0] = x
+    transformed[~has_z, 1] = y
+    x, y, z = transformer.transform(
+        coordinates[has_z, 0], coordinates[has_z, 1], coordinates[has_z, 2]
+    )
+    transformed[has_z] = np.column_stack((x, y, z))
+    return transformed
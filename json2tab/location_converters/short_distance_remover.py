@@ -1,16 +1,18 @@
 """Module with remover to remove wind turbines with short distance."""
 
-import os
-import shutil
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 from scipy.spatial import KDTree
 
 from ..io.readers import read_locationdata_as_dataframe
-from ..io.writers import save_dataframe
+from ..io.writers import save_dataframe, save_dataframe_in_place
 from ..location_converters.get_lat_lon_matrix import get_lat_lon_matrix
 from ..logs import logger
+from ..Turbine import Turbine
 from ..turbine_utils import merge_turbine_data
 
 
@@ -27,32 +29,23 @@ def short_distance_remover(
         min_distance (float):  (Optional) Minimal required distance between turbines
 
     """
-    if output_filename is None:
-        input_filename_base, input_filename_ext = os.path.splitext(input_filename)
-        backup_input_filename = f"{input_filename_base}{input_filename_ext}.orig"
-
-        shutil.copyfile(input_filename, backup_input_filename)
-        logger.info(
-            f"Copied original input-file {input_filename} to "
-            f"{backup_input_filename}, set output-file to {input_filename}"
-        )
-        output_filename = input_filename
-    else:
-        backup_input_filename = None
-
     print(
-        f"Short Distance Remover ({input_filename} -> {output_filename}) with "
+        f"Short Distance Remover ({input_filename} -> "
+        f"{output_filename or input_filename}) with "
         f"min_distance = {min_distance} (~"
         f"{int(111 * 1000 * min_distance) if min_distance is not None else None} "
         f"meter)"
     )
-    logger.debug(f"input filename: {backup_input_filename or input_filename}")
-    logger.debug(f"output filename: {output_filename}")
+    logger.debug(f"input filename: {input_filename}")
+    logger.debug(f"output filename: {output_filename or input_filename}")
 
-    df_input = read_locationdata_as_dataframe(input_filename)
+    df_input = read_locationdata_as_dataframe(input_filename, categorize=True)
     df_merged_output = cleanup_short_distance_turbines(df_input, min_distance)
 
-    save_dataframe(df_merged_output, output_filename)
+    if output_filename is None:
+        save_dataframe_in_place(df_merged_output, input_filename)
+    else:
+        save_dataframe(df_merged_output, output_filename)
 
 
 def cleanup_short_distance_turbines(data: pd.DataFrame, dist: Optional[float] = None):
@@ -69,77 +62,91 @@ def cleanup_short_distance_turbines(data: pd.DataFrame, dist: Optional[float] =
     if dist is None:
         dist = 1.5e-3  # ~150m threshold
 
-    restart = True
-    while restart:
-        df_unique, duplicate_data, min_dist = split_long_short_distance_turbines(
-            data, dist=dist
-        )
+    df_unique, duplicate_groups, min_dist = split_long_short_distance_turbines(
+        data, dist=dist
+    )
+    if min_dist is not None:
         logger.info(
             f"Filtered dataframe to {len(df_unique.index)} turbines "
             f"with at least ~{int(111 * 1000 * min_dist)} meter "
             f"(i.e. {min_dist} degree) distance"
         )
 
-        merged_duplicate_turbines = []
-        for row1, row2 in duplicate_data:
-            duplicate_turbine = merge_turbine_data(row1, row2, row1["source"])
-            merged_duplicate_turbines.append(duplicate_turbine)
-        logger.info(
-            f"Selected {len(merged_duplicate_turbines)} duplicate/merged turbines"
-        )
+    merged_duplicate_turbines = [
+        merge_duplicate_turbines(duplicate_rows) for duplicate_rows in duplicate_groups
+    ]
+    logger.info(f"Selected {len(merged_duplicate_turbines)} duplicate/merged turbines")
 
-        df_duplicate = pd.DataFrame(merged_duplicate_turbines)
-        df_merged_output = pd.concat([df_unique, df_duplicate], ignore_index=True)
+    df_duplicate = pd.DataFrame(merged_duplicate_turbines)
+    return pd.concat([df_unique, df_duplicate], ignore_index=True)
 
-        if len(merged_duplicate_turbines) > 0:
-            data = df_merged_output
-            logger.debug(
-                "Duplicates found, so restart search for duplicates again to find cycles"
-            )
-        else:
-            restart = False
 
-    return df_merged_output
+def merge_duplicate_turbines(duplicate_rows: List[Dict]) -> Turbine:
+    """Merge a group of duplicate turbines into one turbine.
+
+    The turbines are merged in order, so data of the first turbine is preferred.
+
+    Args:
+        duplicate_rows: Data rows of (at least two) duplicate turbines
+
+    Returns:
+        The merged turbine
+    """
+    source = duplicate_rows[0].get("source")
+
+    turbine = merge_turbine_data(duplicate_rows[0], duplicate_rows[1], source)
+    for row in duplicate_rows[2:]:
+        turbine = merge_turbine_data(turbine.to_dict(), row, source)
+
+    return turbine
 
 
 def split_long_short_distance_turbines(
     data: pd.DataFrame, dist: float
-) -> Tuple[pd.DataFrame, float, List[Tuple[int, int]]]:
+) -> Tuple[pd.DataFrame, List[List[Dict]], Optional[float]]:
     """Split turbines to set of long and short distance turbines.
 
+    Turbines closer than dist to each other are grouped (also via other turbines,
+    i.e. chains of nearby turbines form one group) using the connected components
+    of the graph of short distance turbine pairs.
+
     Args:
         data: DataFrame containing wind turbine data
         dist: Minimal distance between turbines (in degrees); default: 1e-3 ~ 100m
 
     Returns:
         filtered_data:     Filtered data with only the turbines with distance >= dist
-        duplicate_data:    List of duplicate rows in dataset
+        duplicate_groups:  List of groups of duplicate rows in dataset
         min_dist:          Minimal distance between turbines in filtered data set
 
     """
-    tree = KDTree(get_lat_lon_matrix(data))
-
-    distances, idx = tree.query(
-        get_lat_lon_matrix(data),
-        k=2,
-        # distance_upper_bound=dist
+    lat_lon = get_lat_lon_matrix(data)
+    n_turbines = len(lat_lon)
+    tree = KDTree(lat_lon)
+
+    # Pairs with a distance strictly smaller than dist
+    pairs = tree.query_pairs(np.nextafter(dist, 0), output_type="ndarray")
+    graph = coo_matrix(
+        (np.ones(len(pairs), dtype=bool), (pairs[:, 0], pairs[:, 1])),
+        shape=(n_turbines, n_turbines),
     )
-
-    duplicate_pairs = {
-        tuple(sorted(idx))
-        for (idx, pair_dist) in zip(idx, distances[:, 1])
-        if pair_dist < dist
-    }
-    duplicate_data = [
-        (data.iloc[idx1], data.iloc[idx2]) for (idx1, idx2) in duplicate_pairs
+    _, labels = connected_components(graph, directed=False)
+
+    group_sizes = np.bincount(labels)
+    selector = group_sizes[labels] == 1
+
+    # Group duplicate turbines (in data order) per component
+    duplicate_idx = np.flatnonzero(~selector)
+    duplicate_idx = duplicate_idx[np.argsort(labels[duplicate_idx], kind="stable")]
+    duplicate_rows = data.iloc[duplicate_idx].to_dict("records")
+    group_ends = np.cumsum(group_sizes[np.unique(labels[duplicate_idx])])
+    duplicate_groups = [
+        duplicate_rows[start:end]
+        for start, end in zip(np.r_[0, group_ends[:-1]], group_ends)
     ]
 
-    # Get rid of self-match
-    distances = distances[:, 1]
-    selector = distances >= dist
-
-    if selector.any():
-        mindist = min(distances[selector])
-        return data[selector], duplicate_data, mindist
+    if selector.any() and n_turbines > 1:
+        distances, _ = tree.query(lat_lon[selector], k=2)
+        return data[selector], duplicate_groups, distances[:, 1].min()
 
-    return data, duplicate_data, None
+    return data[selector], duplicate_groups, None
@@ -62,13 +62,13 @@ def knmi_turbine_database_writer(
                     f" typeID {type_id} containing turbine model '{turbine_model}'"
                 )
 
-                # Read turbine characteristics
+                # Read turbine characteristics (C engine, numeric columns never
+                # contain whitespace, so r"\s+" splits like r"\s\s+" would)
                 dfHeader = pd.read_csv(
                     filename,
-                    sep=r"\s\s+",
+                    sep=r"\s+",
                     header=None,
                     nrows=1,
-                    engine="python",
                     comment="#",
                 )
                 dfHeader.columns = ["r", "z", "cT_low", "cT_high"]
@@ -89,7 +89,6 @@ def knmi_turbine_database_writer(
                     sep=r"\s+",
                     skiprows=[0, 1, 2],
                     header=None,
-                    engine="python",
                     comment="#",
                 )
                 dfData.columns = ["U", "cP", "cT"]
@@ -98,7 +97,7 @@ def knmi_turbine_database_writer(
                 ct = dfData["cT"].tolist()
 
                 logger.debug(
-                    f"Typeid = {type_id}: read {len(dfData['U'].tolist())} lines "
+                    f"Typeid = {type_id}: read {len(wind_speeds)} lines "
                     "of cP and cT curves"
                 )
 
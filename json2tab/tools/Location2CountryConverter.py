@@ -1,13 +1,16 @@
 """Converter to convert lat/lon location to country code."""
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import geopandas as gpd
+import numpy as np
+import shapely
 from shapely.geometry import Point, shape
-from shapely.prepared import prep
 
+from ..io.readers import read_geodataframe
 from ..logs import logger
 
 
@@ -78,15 +81,51 @@ class Location2CountryConverter:
 
         logger.debug(f"Loaded {len(self.countries)} countries")
 
+        # Spatial index over all geometries (in order of self.countries), so a point
+        # is only tested against the geometries whose bounding box contains it
+        self._names = np.array(
+            [country for country, geom_list in self.countries.items() for _ in geom_list],
+            dtype=object,
+        )
+        self._tree = shapely.STRtree(
+            [geom for geom_list in self.countries.values() for geom in geom_list]
+        )
+
     def get_country(self, lon, lat):
         """Gets the country of a lat/lon coordinate."""
-        point = Point(lon, lat)
-        for country, geom_list in self.countries.items():
-            for geom in geom_list:
-                if geom.contains(point):
-                    return country
+        indices = self._tree.query(Point(lon, lat), predicate="within")
+        if len(indices) == 0:
+            return None
+
+        # Prefer the first matching country, like a linear search over the countries
+        return self._names[indices.min()]
+
+    def get_countries(self, lon, lat) -> np.ndarray:
+        """Gets the countries of arrays of lat/lon coordinates.
+
+        Vectorized variant of `get_country`; coordinates in multiple countries are
+        assigned to the first matching country, like in `get_country`.
 
-        return None
+        Args:
+            lon: Array-like with longitudes
+            lat: Array-like with latitudes
+
+        Returns:
+            numpy.ndarray with the country per coordinate (None if not in a country)
+        """
+        points = shapely.points(
+            np.asarray(lon, dtype=float), np.asarray(lat, dtype=float)
+        )
+        point_indices, geom_indices = self._tree.query(points, predicate="within")
+
+        n_geoms = len(self._names)
+        first_match = np.full(len(points), n_geoms)
+        np.minimum.at(first_match, point_indices, geom_indices)
+
+        countries = np.full(len(points), None, dtype=object)
+        found = first_match < n_geoms
+        countries[found] = self._names[first_match[found]]
+        return countries
 
     @staticmethod
     def _countries_from_json_file(
@@ -127,7 +166,9 @@ class Location2CountryConverter:
                 if country is not None:
                     if country not in countries:
                         countries[country] = []
-                    countries[country].append(prep(shape(geometry)))
+                    geometry = shape(geometry)
+                    shapely.prepare(geometry)
+                    countries[country].append(geometry)
 
         return countries
 
@@ -157,7 +198,7 @@ class Location2CountryConverter:
         logger.debug(f"country_field = '{country_field}' (len={len(country_field)})")
         logger.debug(f"geometry_field = '{geometry_field}'")
 
-        data = gpd.read_file(file_name, layer=layer)
+        data = read_geodataframe(file_name, layer=layer)
 
         countries = {}
         for _, row in data.iterrows():
@@ -172,6 +213,32 @@ class Location2CountryConverter:
             if country is not None:
                 if country not in countries:
                     countries[country] = []
-                countries[country].append(prep(shape(geometry)))
+                geometry = shape(geometry)
+                shapely.prepare(geometry)
+                countries[country].append(geometry)
 
         return countries
+
+
+def get_location2country_converter(country_border_file: str) -> Location2CountryConverter:
+    """Gets a (cached) converter for a country border file.
+
+    Converters are reused as long as the file is not modified, so large border files
+    are only loaded (and indexed) once per process.
+
+    Args:
+        country_border_file: Filename with border information of countries
+
+    Returns:
+        Location2CountryConverter for the country border file
+    """
+    filename = os.path.abspath(country_border_file)
+    return _cached_location2country_converter(filename, os.path.getmtime(filename))
+
+
+@lru_cache(maxsize=8)
+def _cached_location2country_converter(
+    country_border_file: str, _mtime: float
+) -> Location2CountryConverter:
+    """Creates a converter, cached by filename and modification time (_mtime)."""
+    return Location2CountryConverter(country_border_file)
@@ -2,7 +2,7 @@
 
 import contextlib
 import math
-from typing import Optional
+from typing import Optional, Tuple
 
 import pandas as pd
 
@@ -18,6 +18,71 @@ from .utils import (
     power_to_kw,
 )
 
+# Data fields (in order of preference) to derive the Turbine fields from
+ID_FIELDS = ["id", "ID", "GSRN", "Turbine identifier (GSRN)", "Verk-ID"]
+NAME_FIELDS = ["name", "Name", "naam", "Turbine", "WFNAME", "nr_turbine", "Location"]
+ALT_NAME_FIELDS = ["2nd name", "alt_name", "alt name"]
+TURBINE_ID_FIELDS = [
+    "turbine_id",
+    "turbine_nr",
+    "nr_turbine",
+    "turbine id",
+    "Turbine identifier (GSRN)",
+]
+MANUFACTURER_FIELDS = ["manufacturer", "Manufacturer", "Manufacture", "Fabrikat"]
+TYPE_FIELDS = [
+    "type",
+    "wt_type",
+    "WTYPE",
+    "turbine_type",
+    "model",
+    "Type designation",
+    "Model wind turbine",
+    "Modell",
+    "Turbine",
+]
+WF101_TYPE_FIELDS = ["wf101_type"]
+IS_OFFSHORE_FIELDS = ["is_offshore", "ondergrond", "Type of location", "Placering"]
+WIND_FARM_FIELDS = [
+    "nicename",
+    "windfarm",
+    "wind_farm",
+    "WFNAME",
+    "site",
+    "farm id",
+    "name",
+    "Name",
+    "naam",
+    "Location",
+    "Projekteringsområde",
+]
+N_TURBINES_FIELDS = ["n_turbines", "Number of turbines", "No. of wind turbines"]
+START_DATE_FIELDS = [
+    "start_date",
+    "commission_date",
+    "commissioning",
+    "Date of commission",
+    "year",
+    "Date of original connection to grid",
+    "Uppfört",
+    "Commissioning date",
+]
+END_DATE_FIELDS = [
+    "end_date",
+    "decommission_date",
+    "decommissioning",
+    "Date of decommissioning",
+    "Date of decommissioning",
+    "Nedmonterat",
+    "Decommissioning date",
+]
+COUNTRY_FIELDS = ["country", "Country", "land"]
+CUT_IN_SPEED_FIELDS = ["cut_in_speed", "v_in"]
+CUT_OUT_SPEED_FIELDS = ["cut_out_speed", "v_out"]
+RATED_SPEED_FIELDS = ["rated_speed", "v_rated"]
+OPERATOR_FIELDS = ["operator"]
+HEIGHT_OFFSET_FIELDS = ["height_offset", "Markhöjd (m)"]
+
 
 def standarize_dataframe(data: pd.DataFrame, always: bool = False) -> pd.DataFrame:
     """Convertion a pandas.DataFrame to a dataframe with standarized turbine fields.
@@ -38,14 +103,30 @@ def standarize_dataframe(data: pd.DataFrame, always: bool = False) -> pd.DataFra
             "standarized turbine data."
         )
 
-        turbines = []
-        for _, row in data.iterrows():
-            turbines.append(datarow_to_turbine(row))
+        turbines = [datarow_to_turbine(row) for row in data.to_dict("records")]
 
         data = pd.DataFrame(turbines)
     return data
 
 
+def categorize_static_columns(
+    data: pd.DataFrame, columns: Tuple[str, ...] = ("country", "source")
+) -> pd.DataFrame:
+    """Store columns with few distinct values (like country and source) as category.
+
+    Args:
+        data (pandas.DataFrame): The dataframe containing turbine information
+        columns (tuple[str]):    Columns to convert to categorical dtype
+
+    Returns:
+        pandas.DataFrame with the given columns stored as category
+    """
+    for column in columns:
+        if column in data.columns:
+            data[column] = data[column].astype("category")
+    return data
+
+
 def datarow_to_turbine(row) -> Turbine:
     """Convert data row to Turbine."""
     return merge_turbine_data(row, None)
@@ -64,12 +145,16 @@ def merge_turbine_data(
     Returns:
         Merged turbine
     """
+    # Convert (row) sources to dict once, instead of once per looked up field
+    preferred_source = _as_dict(preferred_source)
+    alternative_source = _as_dict(alternative_source)
+
     alternative_used = False
 
     id_field, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["id", "ID", "GSRN", "Turbine identifier (GSRN)", "Verk-ID"],
-            source if isinstance(source, dict) else source.to_dict(),
+            ID_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -78,8 +163,8 @@ def merge_turbine_data(
     )
     name, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["name", "Name", "naam", "Turbine", "WFNAME", "nr_turbine", "Location"],
-            source if isinstance(source, dict) else source.to_dict(),
+            NAME_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -89,8 +174,8 @@ def merge_turbine_data(
 
     name2, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["2nd name", "alt_name", "alt name"],
-            source if isinstance(source, dict) else source.to_dict(),
+            ALT_NAME_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -106,14 +191,8 @@ def merge_turbine_data(
 
     turbine_id, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            [
-                "turbine_id",
-                "turbine_nr",
-                "nr_turbine",
-                "turbine id",
-                "Turbine identifier (GSRN)",
-            ],
-            source if isinstance(source, dict) else source.to_dict(),
+            TURBINE_ID_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -121,16 +200,12 @@ def merge_turbine_data(
         alternative_used,
     )
 
-    lat, lon = get_lat_lon(
-        preferred_source
-        if isinstance(preferred_source, dict)
-        else preferred_source.to_dict()
-    )
+    lat, lon = get_lat_lon(preferred_source)
 
     manufacturer, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["manufacturer", "Manufacturer", "Manufacture", "Fabrikat"],
-            source if isinstance(source, dict) else source.to_dict(),
+            MANUFACTURER_FIELDS,
+            source,
             default=default,
         ),
         preferred_source,
@@ -139,18 +214,8 @@ def merge_turbine_data(
     )
     model_type, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            [
-                "type",
-                "wt_type",
-                "WTYPE",
-                "turbine_type",
-                "model",
-                "Type designation",
-                "Model wind turbine",
-                "Modell",
-                "Turbine",
-            ],
-            source if isinstance(source, dict) else source.to_dict(),
+            TYPE_FIELDS,
+            source,
             default=default,
         ),
         preferred_source,
@@ -161,8 +226,8 @@ def merge_turbine_data(
         # Only use WF-101 type if we realy don't have any other type
         model_type, alternative_used = fetch_data(
             lambda source, default=None: get_value_from_dict(
-                ["wf101_type"],
-                source if isinstance(source, dict) else source.to_dict(),
+                WF101_TYPE_FIELDS,
+                source,
                 default=default,
             ),
             preferred_source,
@@ -191,8 +256,8 @@ def merge_turbine_data(
 
     is_offshore, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["is_offshore", "ondergrond", "Type of location", "Placering"],
-            source if isinstance(source, dict) else source.to_dict(),
+            IS_OFFSHORE_FIELDS,
+            source,
             default=default,
         ),
         preferred_source,
@@ -201,20 +266,8 @@ def merge_turbine_data(
     )
     wind_farm, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            [
-                "nicename",
-                "windfarm",
-                "wind_farm",
-                "WFNAME",
-                "site",
-                "farm id",
-                "name",
-                "Name",
-                "naam",
-                "Location",
-                "Projekteringsområde",
-            ],
-            source if isinstance(source, dict) else source.to_dict(),
+            WIND_FARM_FIELDS,
+            source,
             default=default,
         ),
         preferred_source,
@@ -223,8 +276,8 @@ def merge_turbine_data(
     )
     n_turbines, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["n_turbines", "Number of turbines", "No. of wind turbines"],
-            source if isinstance(source, dict) else source.to_dict(),
+            N_TURBINES_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -254,17 +307,8 @@ def merge_turbine_data(
 
     start_date, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            [
-                "start_date",
-                "commission_date",
-                "commissioning",
-                "Date of commission",
-                "year",
-                "Date of original connection to grid",
-                "Uppfört",
-                "Commissioning date",
-            ],
-            source if isinstance(source, dict) else source.to_dict(),
+            START_DATE_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -273,16 +317,8 @@ def merge_turbine_data(
     )
     end_date, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            [
-                "end_date",
-                "decommission_date",
-                "decommissioning",
-                "Date of decommissioning",
-                "Date of decommissioning",
-                "Nedmonterat",
-                "Decommissioning date",
-            ],
-            source if isinstance(source, dict) else source.to_dict(),
+            END_DATE_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -291,8 +327,8 @@ def merge_turbine_data(
     )
     country, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["country", "Country", "land"],
-            source if isinstance(source, dict) else source.to_dict(),
+            COUNTRY_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -302,8 +338,8 @@ def merge_turbine_data(
 
     cut_in_speed, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["cut_in_speed", "v_in"],
-            source if isinstance(source, dict) else source.to_dict(),
+            CUT_IN_SPEED_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -312,8 +348,8 @@ def merge_turbine_data(
     )
     cut_out_speed, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["cut_out_speed", "v_out"],
-            source if isinstance(source, dict) else source.to_dict(),
+            CUT_OUT_SPEED_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -322,8 +358,8 @@ def merge_turbine_data(
     )
     rated_speed, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["rated_speed", "v_rated"],
-            source if isinstance(source, dict) else source.to_dict(),
+            RATED_SPEED_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -333,8 +369,8 @@ def merge_turbine_data(
 
     operator, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["operator"],
-            source if isinstance(source, dict) else source.to_dict(),
+            OPERATOR_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -343,8 +379,8 @@ def merge_turbine_data(
     )
     height_offset, alternative_used = fetch_data(
         lambda source, default=None: get_value_from_dict(
-            ["height_offset", "Markhöjd (m)"],
-            source if isinstance(source, dict) else source.to_dict(),
+            HEIGHT_OFFSET_FIELDS,
+            source,
             default,
         ),
         preferred_source,
@@ -412,6 +448,13 @@ def merge_turbine_data(
     )
 
 
+def _as_dict(source) -> Optional[dict]:
+    """Convert a dict-like source (e.g. pandas.Series) to a dict."""
+    if source is None or isinstance(source, dict):
+        return source
+    return source.to_dict()
+
+
 def fetch_data(
     fetcher, preferred_source, alternative_source, alternative_used: bool = False
 ):
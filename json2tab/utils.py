@@ -6,6 +6,91 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from .logs import logger
 
+RADIUS_FIELDS = ["radius", "radius (m)"]
+"""Data fields (in order of preference) containing the rotor radius."""
+
+DIAMETER_FIELDS = [
+    "diameter",
+    "diameter (m)",
+    "rotor_diameter",
+    "rotor diameter",
+    "rotor diameter (m)",
+    "Rotor diameter (m)",
+    "Rotordiameter (m)",
+    "diam",
+]
+"""Data fields (in order of preference) containing the rotor diameter."""
+
+HEIGHT_FIELDS = [
+    "hubheight",
+    "hub_height",
+    "hub height",
+    "Hub height",
+    "hub height (m)",
+    "Hub height",
+    "Hub height (m)",
+    "height",
+    "z_height (m)",
+    "z_height",
+    "ash",
+    "hoogte_paa",
+    "Navhöjd (m)",
+]
+"""Data fields (in order of preference) containing the hub height."""
+
+RATED_POWER_FIELDS = [
+    "rated_power_kw",
+    "rated_power_mw",
+    "rated_power",
+    "rated power",
+    "Rated power (kW)",
+    "Rated power (MW)",
+    "Rated power",
+    "power_rating_kw",
+    "power_rating_mw",
+    "power_rating",
+    "power rating",
+    "kw",
+    "power_kw",
+    "power_mw",
+    "power",
+    "vermogen_m",
+    "P_rated",
+    "nominal power (kW)",
+    "nominal power (MW)",
+    "nominal power",
+    "nominal_power_kw",
+    "nominal_power_mw",
+    "nominal_power",
+    "capacity",
+    "Capacity (kW)",
+    "Capacity (MW)",
+    "Capacity",
+    "Maxeffekt (kW)",
+    "Maxeffekt (MW)",
+]
+"""Data fields (in order of preference) containing the rated power."""
+
+INSTALLED_POWER_FIELDS = [
+    "installed_power",
+    "installed_power_mw",
+    "installed_power_kw",
+    "installed power",
+    "Installed power",
+    "Installed power [MW]",
+    "Installed power [KW]",
+    "installed_capacity",
+    "installed_capacity_kW",
+    "installed_capacity_MW",
+    "installed capacity",
+    "Installed capacity [MW]",
+    "Installed capacity [KW]",
+    "Total power",
+    "Total power [kW]",
+    "Total power [MW]",
+]
+"""Data fields (in order of preference) containing the installed power."""
+
 
 def print_processing_status(
     counter: int,
@@ -197,23 +282,12 @@ def get_radius_from_dict(data: Dict, default: float = 0.0) -> float:
     Returns:
         A valid (not None, empty or NaN) float value for radius, otherwise default
     """
-    radius, _ = get_float_from_dict(
-        ["radius", "radius (m)"], data, default, require_positive=True
-    )
+    radius, _ = get_float_from_dict(RADIUS_FIELDS, data, default, require_positive=True)
     if radius and radius > 0:
         return radius
 
     diameter, _ = get_float_from_dict(
-        [
-            "diameter",
-            "diameter (m)",
-            "rotor_diameter",
-            "rotor diameter",
-            "rotor diameter (m)",
-            "Rotor diameter (m)",
-            "Rotordiameter (m)",
-            "diam",
-        ],
+        DIAMETER_FIELDS,
         data,
         default,
         require_positive=True,
@@ -290,28 +364,14 @@ def get_height(specs: Dict | List[Dict], default: float = 0.0) -> float:
     Returns:
         A valid (not None, empty or NaN) float value for height, otherwise default
     """
-    fields = [
-        "hubheight",
-        "hub_height",
-        "hub height",
-        "Hub height",
-        "hub height (m)",
-        "Hub height",
-        "Hub height (m)",
-        "height",
-        "z_height (m)",
-        "z_height",
-        "ash",
-        "hoogte_paa",
-        "Navhöjd (m)",
-    ]
-
     if isinstance(specs, list):
         height, _ = get_float_from_dict_list(
-            fields, specs, default, require_positive=True
+            HEIGHT_FIELDS, specs, default, require_positive=True
         )
     else:
-        height, _ = get_float_from_dict(fields, specs, default, require_positive=True)
+        height, _ = get_float_from_dict(
+            HEIGHT_FIELDS, specs, default, require_positive=True
+        )
 
     return height
 
@@ -329,49 +389,17 @@ def get_rated_power_kw(
     Returns:
         Rated power (in kW)
     """
-    power_fields = [
-        "rated_power_kw",
-        "rated_power_mw",
-        "rated_power",
-        "rated power",
-        "Rated power (kW)",
-        "Rated power (MW)",
-        "Rated power",
-        "power_rating_kw",
-        "power_rating_mw",
-        "power_rating",
-        "power rating",
-        "kw",
-        "power_kw",
-        "power_mw",
-        "power",
-        "vermogen_m",
-        "P_rated",
-        "nominal power (kW)",
-        "nominal power (MW)",
-        "nominal power",
-        "nominal_power_kw",
-        "nominal_power_mw",
-        "nominal_power",
-        "capacity",
-        "Capacity (kW)",
-        "Capacity (MW)",
-        "Capacity",
-        "Maxeffekt (kW)",
-        "Maxeffekt (MW)",
-    ]
-
     diameter = None
     if isinstance(specs, list):
         rated_power, key = get_float_from_dict_list(
-            power_fields, specs, default, require_positive=True
+            RATED_POWER_FIELDS, specs, default, require_positive=True
         )
         radius = get_radius_from_dict_list(specs, None)
         if radius is not None:
             diameter = 2 * radius
     else:
         rated_power, key = get_float_from_dict(
-            power_fields, specs, default, require_positive=True
+            RATED_POWER_FIELDS, specs, default, require_positive=True
         )
         radius = get_radius_from_dict(specs, None)
         if radius is not None:
@@ -401,32 +429,13 @@ def get_installed_power(specs: Dict[str, Any] | List[Dict], default: float = 0)
     Returns:
         Installed power
     """
-    power_fields = [
-        "installed_power",
-        "installed_power_mw",
-        "installed_power_kw",
-        "installed power",
-        "Installed power",
-        "Installed power [MW]",
-        "Installed power [KW]",
-        "installed_capacity",
-        "installed_capacity_kW",
-        "installed_capacity_MW",
-        "installed capacity",
-        "Installed capacity [MW]",
-        "Installed capacity [KW]",
-        "Total power",
-        "Total power [kW]",
-        "Total power [MW]",
-    ]
-
     if isinstance(specs, list):
         installed_power, key = get_float_from_dict_list(
-            power_fields, specs, default, require_positive=True
+            INSTALLED_POWER_FIELDS, specs, default, require_positive=True
         )
     else:
         installed_power, key = get_float_from_dict(
-            power_fields, specs, default, require_positive=True
+            INSTALLED_POWER_FIELDS, specs, default, require_positive=True
         )
 
     return installed_power or default
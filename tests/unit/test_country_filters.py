@@ -0,0 +1,100 @@
+import pandas as pd
+import pytest
+
+from json2tab.location_converters import country_filters
+from json2tab.location_converters.country_filters import (
+    remove_from_countries,
+    select_from_countries,
+    select_offshore,
+    select_onshore,
+)
+
+TURBINES = pd.DataFrame(
+    {
+        "name": [f"turbine {i}" for i in range(5)],
+        "latitude": [52.0, 50.8, 52.1, 51.0, 52.2],
+        "longitude": [5.0, 4.3, 5.1, 4.4, 5.2],
+        "country": ["Netherlands", "Belgium", "Netherlands", "Belgium", "Netherlands"],
+        "source": ["test"] * 5,
+    }
+)
+
+
+@pytest.fixture()
+def turbines_file(tmp_path):
+    input_filename = tmp_path / "turbines.csv"
+    TURBINES.to_csv(input_filename, index=False)
+    return str(input_filename)
+
+
+def test_select_offshore_onshore_skip_missing_is_offshore(tmp_path):
+    input_filename = tmp_path / "turbines.csv"
+    input_filename.write_text(
+        "name,latitude,longitude,is_offshore\n"
+        "turbine 0,52.0,3.0,True\n"
+        "turbine 1,52.0,5.0,False\n"
+        "turbine 2,52.0,4.0,\n"
+    )
+
+    offshore = select_offshore(str(input_filename), str(tmp_path / "offshore.csv"))
+    onshore = select_onshore(str(input_filename), str(tmp_path / "onshore.csv"))
+
+    assert list(offshore["name"]) == ["turbine 0"]
+    assert list(onshore["name"]) == ["turbine 1"]
+    assert list(pd.read_csv(tmp_path / "offshore.csv")["name"]) == ["turbine 0"]
+    assert list(pd.read_csv(tmp_path / "onshore.csv")["name"]) == ["turbine 1"]
+
+
+@pytest.mark.parametrize("chunksize", [2, 200_000])
+def test_select_from_countries_in_chunks(monkeypatch, tmp_path, turbines_file, chunksize):
+    monkeypatch.setattr(country_filters, "CSV_CHUNKSIZE", chunksize)
+    output_filename = tmp_path / "selected.csv"
+
+    data = select_from_countries(turbines_file, str(output_filename), "Netherlands")
+
+    expected = ["turbine 0", "turbine 2", "turbine 4"]
+    assert list(data["name"]) == expected
+    assert isinstance(data["country"].dtype, pd.CategoricalDtype)
+    assert list(pd.read_csv(output_filename)["name"]) == expected
+
+
+def test_remove_from_countries_in_chunks_in_place(monkeypatch, tmp_path, turbines_file):
+    monkeypatch.setattr(country_filters, "CSV_CHUNKSIZE", 2)
+
+    data = remove_from_countries(turbines_file, None, ["Netherlands"])
+
+    assert list(data["name"]) == ["turbine 1", "turbine 3"]
+    assert list(pd.read_csv(turbines_file)["name"]) == ["turbine 1", "turbine 3"]
+    pd.testing.assert_frame_equal(pd.read_csv(f"{turbines_file}.orig"), TURBINES)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "turbines.csv",
+        "turbines.csv.orig",
+    ]
+
+
+@pytest.mark.parametrize("content", ["", "name,latitude,longitude,country\n"])
+def test_select_from_countries_empty_csv(tmp_path, content):
+    input_filename = tmp_path / "turbines.csv"
+    input_filename.write_text(content)
+
+    data = select_from_countries(
+        str(input_filename), str(tmp_path / "selected.csv"), "Netherlands"
+    )
+
+    assert len(data.index) == 0
+
+
+@pytest.mark.parametrize("in_place", [True, False])
+def test_select_all_turbines_without_filtering(tmp_path, turbines_file, in_place):
+    output_filename = None if in_place else str(tmp_path / "selected.csv")
+
+    data = select_from_countries(
+        turbines_file, output_filename, ["Netherlands", "Belgium"]
+    )
+
+    assert list(data["name"]) == list(TURBINES["name"])
+    pd.testing.assert_frame_equal(pd.read_csv(turbines_file), TURBINES)
+    if in_place:
+        pd.testing.assert_frame_equal(pd.read_csv(f"{turbines_file}.orig"), TURBINES)
+    else:
+        pd.testing.assert_frame_equal(pd.read_csv(output_filename), TURBINES)
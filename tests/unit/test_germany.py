@@ -0,0 +1,56 @@
+import pandas as pd
+
+from json2tab.location_converters.country_data.germany import germany
+
+KATALOG = (
+    '<?xml version="1.0" encoding="utf-16"?>\n<Katalogwerte>'
+    "<Katalogwert><Id>1</Id><Wert>Windkraft an Land</Wert></Katalogwert>"
+    "</Katalogwerte>"
+)
+
+
+def make_unit(mastr_id, **fields):
+    elements = "".join(f"<{field}>{value}</{field}>" for field, value in fields.items())
+    return (
+        f"<EinheitWind><EinheitMastrNummer>{mastr_id}</EinheitMastrNummer>"
+        f"<Breitengrad>52.0</Breitengrad><Laengengrad>8.0</Laengengrad>"
+        f"<Rotordurchmesser>120</Rotordurchmesser>"
+        f"<WindAnLandOderAufSee>1</WindAnLandOderAufSee>{elements}</EinheitWind>"
+    )
+
+
+def test_germany_power_and_start_date_fallbacks(tmp_path):
+    units = [
+        make_unit(
+            "SEE1",
+            Nettonennleistung=2900,
+            Bruttoleistung=3000,
+            InbetriebnahmedatumAmAktuellenStandort="2016-01-01",
+            Inbetriebnahmedatum="2010-01-01",
+        ),
+        make_unit(
+            "SEE2",
+            Nettonennleistung=0,
+            Bruttoleistung=5000,
+            Inbetriebnahmedatum="2015-01-01",
+        ),
+        make_unit("SEE3", Bruttoleistung=2000, Inbetriebnahmedatum="2001-01-01"),
+        make_unit("SEE4", Nettonennleistung=1500),
+    ]
+    input_filename = tmp_path / "EinheitenWind.xml"
+    input_filename.write_text(
+        '<?xml version="1.0" encoding="utf-16"?>\n'
+        f"<EinheitenWind>{''.join(units)}</EinheitenWind>",
+        encoding="utf-16",
+    )
+    katalog_file = tmp_path / "Katalogwerte.xml"
+    katalog_file.write_text(KATALOG, encoding="utf-16")
+
+    data = germany(str(input_filename), str(tmp_path / "germany.csv"), str(katalog_file))
+
+    # Units without any commissioning date are not (yet) in operation
+    assert list(data["id"]) == ["SEE1", "SEE2", "SEE3"]
+    # Only a zero net power falls back to the gross power
+    assert data["power_rating"].tolist()[:2] == [2900, 5000]
+    assert pd.isna(data["power_rating"][2])
+    assert list(data["start_date"]) == ["2016-01-01", "2015-01-01", "2001-01-01"]
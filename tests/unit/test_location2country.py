@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 import pytest
@@ -148,3 +149,29 @@ def test_netherlands_name(country_border_file, lon, lat, expected):
         l2c = Location2CountryConverter(country_border_file, level, prefer_iso3=False)
         country = l2c.get_country(lon, lat)
         assert country == expected[level]
+
+
+def test_countries_from_json_file_skips_features_without_country(tmp_path):
+    square = [[[4.0, 52.0], [5.0, 52.0], [5.0, 53.0], [4.0, 53.0], [4.0, 52.0]]]
+    features = [
+        {
+            "type": "Feature",
+            "properties": {"name": "Netherlands"},
+            "geometry": {"type": "Polygon", "coordinates": square},
+        },
+        {
+            "type": "Feature",
+            "properties": {},
+            "geometry": {"type": "Polygon", "coordinates": square},
+        },
+    ]
+    country_border_file = tmp_path / "borders.geojson"
+    country_border_file.write_text(
+        json.dumps({"type": "FeatureCollection", "features": features})
+    )
+
+    l2c = Location2CountryConverter(str(country_border_file))
+    assert list(l2c.countries) == ["Netherlands"]
+    assert l2c.get_country(4.5, 52.5) == "Netherlands"
+    assert l2c.get_country(6.0, 52.5) is None
+    assert list(l2c.get_countries([4.5, 6.0], [52.5, 52.5])) == ["Netherlands", None]
@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from json2tab.location_converters.country_data.netherlands import (
+    enrich_from_nearest_turbines,
+)
+from json2tab.location_converters.LocationMerger import (
+    get_nearest_turbine,
+    merge_turbine_data,
+)
+from json2tab.turbine_utils import datarow_to_turbine
+
+# Onshore reference turbines (RIVM) with full specs
+RIVM_DATA = pd.DataFrame(
+    {
+        "name": ["near", "far", "isolated"],
+        "latitude": [52.0018, 52.0036, 53.0],
+        "longitude": [4.0, 4.0, 4.5],
+        "hub_height": [80.0, 90.0, 100.0],
+        "diameter": [100.0, 120.0, 140.0],
+        "type": ["V100", "V120", "V140"],
+        "is_offshore": [False, False, False],
+        "source": ["RIVM"] * 3,
+    }
+)
+
+# Turbines (RWS) with poor specs
+RWS_ROWS = [
+    # Nearest turbine ('near', ~200m) within 10 diameters
+    {"name": "rws 0", "latitude": 52.0, "longitude": 4.0, "is_offshore": True},
+    # Nearest turbine ('isolated', ~2.2km) further than 10 diameters
+    {"name": "rws 1", "latitude": 52.98, "longitude": 4.5, "is_offshore": True},
+    # Onshore turbines are never enriched
+    {"name": "rws 2", "latitude": 52.0, "longitude": 4.0001, "is_offshore": False},
+    # No turbine within tolerance
+    {"name": "rws 3", "latitude": 60.0, "longitude": 10.0, "is_offshore": True},
+]
+for row in RWS_ROWS:
+    row["source"] = "RWS"
+
+
+def enrich_per_turbine(turbines, rows, reference_data):
+    """Per-turbine enrichment (with geopy distances) as reference implementation."""
+    enriched_turbines = []
+    for turbine, row in zip(turbines, rows):
+        nearest_turbine, dist, _ = get_nearest_turbine(reference_data, turbine, tol=1)
+        if nearest_turbine is not None:
+            turbine_enriched = merge_turbine_data(
+                row, nearest_turbine.iloc[0], merged_source_name=row["source"]
+            )
+            if (
+                turbine_enriched.is_offshore
+                and dist is not None
+                and dist < 10 * turbine_enriched.diameter
+            ):
+                enriched_turbines.append(turbine_enriched)
+                continue
+        enriched_turbines.append(turbine)
+    return enriched_turbines
+
+
+def test_enrich_from_nearest_turbines():
+    pytest.importorskip("geopy")
+    turbines = [datarow_to_turbine(row) for row in RWS_ROWS]
+
+    enriched = enrich_from_nearest_turbines(turbines, RWS_ROWS, RIVM_DATA)
+
+    assert [turbine.type for turbine in enriched] == ["V100", None, None, None]
+    assert enriched[0].diameter == 100.0
+    # get_nearest_turbine requires a turbine within tolerance
+    assert enriched[:3] == enrich_per_turbine(turbines[:3], RWS_ROWS[:3], RIVM_DATA)
+
+
+def test_enrich_from_nearest_turbines_without_reference_data():
+    turbines = [datarow_to_turbine(row) for row in RWS_ROWS]
+
+    assert enrich_from_nearest_turbines(turbines, RWS_ROWS, RIVM_DATA.iloc[:0]) == (
+        turbines
+    )
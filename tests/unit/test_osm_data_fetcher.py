@@ -0,0 +1,100 @@
+import json
+import logging
+
+import pandas as pd
+import pytest
+
+from json2tab.location_converters.osm_data_fetcher import (
+    get_element_by_id,
+    get_elements_by_ids,
+    get_lat_lon_from_element,
+    osm_data_fetcher,
+    parse_offshore_tags,
+)
+
+
+def test_parse_offshore_tags(caplog):
+    offshore_tags = pd.Series(["yes", "no", None, "partial", "yes"])
+
+    with caplog.at_level(logging.WARNING, logger="json2tab.logs"):
+        is_offshore = parse_offshore_tags(offshore_tags)
+
+    assert is_offshore.dtype == "boolean"
+    assert is_offshore.tolist() == [True, False, pd.NA, pd.NA, True]
+    assert "Ignored 1 unknown offshore tag values: 'partial'" in caplog.text
+
+
+WIND_TURBINE = {"power": "generator", "generator:source": "wind"}
+
+OVERPASS_ELEMENTS = [
+    {"type": "node", "id": 1, "lat": 52.0, "lon": 4.0, "tags": WIND_TURBINE},
+    {"type": "node", "id": 2, "lat": 52.1, "lon": 4.1},
+    {"type": "node", "id": 3, "lat": 52.3, "lon": 4.3},
+    {"type": "node", "id": 4, "lat": 53.0, "lon": 5.0},
+    {"type": "node", "id": 5, "lat": 52.5, "lon": 4.5, "tags": {"power": "tower"}},
+    {"type": "way", "id": 10, "nodes": [3, 2], "tags": WIND_TURBINE},
+    {
+        "type": "relation",
+        "id": 100,
+        "members": [
+            {"type": "node", "ref": 4, "role": "generator"},
+            {"type": "node", "ref": 1, "role": ""},
+            {"type": "node", "ref": 5, "role": ""},
+            {"type": "way", "ref": 10, "role": ""},
+        ],
+        "tags": {
+            "power": "plant",
+            "plant:source": "wind",
+            "name": "WF",
+            "plant:output:electricity": "6 MW",
+        },
+    },
+]
+
+
+def group_elements(overpass_elements):
+    elements = {"node": [], "way": [], "relation": []}
+    for element in overpass_elements:
+        elements[element["type"]].append(element)
+    return elements
+
+
+def test_get_elements_by_ids_in_data_order():
+    elements = group_elements(OVERPASS_ELEMENTS)
+
+    nodes = get_elements_by_ids(elements, "node", [5, 1, 3, 42])
+
+    assert [node["id"] for node in nodes] == [1, 3, 5]
+    assert get_element_by_id(elements, "way", 10)["id"] == 10
+    assert get_element_by_id(elements, "way", 42) is None
+
+
+def test_get_lat_lon_from_way_and_relation():
+    elements = group_elements(OVERPASS_ELEMENTS)
+    way = get_element_by_id(elements, "way", 10)
+    relation = get_element_by_id(elements, "relation", 100)
+
+    assert get_lat_lon_from_element(way, elements) == pytest.approx((52.2, 4.2))
+    # Mean of the way centroid and the member nodes
+    assert get_lat_lon_from_element(relation, elements) == pytest.approx((52.425, 4.425))
+
+
+def test_osm_data_fetcher_maps_windfarm_members(tmp_path):
+    pytest.importorskip("requests")
+    input_filename = tmp_path / "overpass_output.json"
+    input_filename.write_text(json.dumps({"elements": OVERPASS_ELEMENTS}))
+
+    turbines = osm_data_fetcher(str(tmp_path / "osm.csv"), str(input_filename))
+
+    assert list(turbines["turbine_id"]) == ["node-1", "node-4", "way-10"]
+    assert list(turbines["latitude"]) == pytest.approx([52.0, 53.0, 52.2])
+    assert list(turbines["longitude"]) == pytest.approx([4.0, 5.0, 4.2])
+    # Members of the windfarm share its installed capacity
+    assert list(turbines["wind_farm"][:2]) == ["WF [relation-100]"] * 2
+    assert list(turbines["power_rating"][:2]) == [3000.0, 3000.0]
+    assert pd.isna(turbines["wind_farm"][2])
+
+    windfarms = pd.read_csv(tmp_path / "osm.windfarms.csv")
+    assert list(windfarms["turbine_id"]) == ["relation-100"]
+    assert list(windfarms["mapped_turbines"]) == [2]
+    assert list(windfarms["installed_capacity"]) == [6000.0]
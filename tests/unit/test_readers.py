@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from json2tab.io import readers
+
+
+class ArrowInvalidError(ValueError):
+    pass
+
+
+@pytest.mark.parametrize(
+    "error",
+    [pd.errors.ParserError("pyarrow failed"), ArrowInvalidError("pyarrow failed")],
+)
+def test_read_csv_falls_back_when_pyarrow_fails(monkeypatch, tmp_path, error):
+    input_filename = tmp_path / "turbines.csv"
+    input_filename.write_text("name,latitude,longitude\nturbine 0,52.0,5.0\n")
+
+    pandas_read_csv = pd.read_csv
+    engines = []
+
+    def read_csv(*args, **kwargs):
+        engines.append(kwargs.get("engine"))
+        if kwargs.get("engine") == "pyarrow":
+            raise error
+        return pandas_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(
+        readers, "pyarrow", SimpleNamespace(ArrowInvalid=ArrowInvalidError)
+    )
+    monkeypatch.setattr(pd, "read_csv", read_csv)
+
+    data = readers.read_csv(str(input_filename))
+
+    assert engines == ["pyarrow", None]
+    assert list(data["name"]) == ["turbine 0"]
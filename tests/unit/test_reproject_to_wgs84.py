@@ -0,0 +1,34 @@
+import geopandas as gpd
+import pytest
+import shapely
+
+from json2tab.location_converters import reproject_to_wgs84 as reproject
+
+
+@pytest.mark.parametrize("min_coordinates_per_thread", [50_000, 1])
+def test_reproject_to_wgs84_matches_to_crs(monkeypatch, min_coordinates_per_thread):
+    monkeypatch.setattr(
+        reproject, "MIN_COORDINATES_PER_THREAD", min_coordinates_per_thread
+    )
+    geometries = [
+        shapely.Point(100000, 400000, 10.0),
+        shapely.Point(120000, 410000),
+        shapely.LineString([(110000, 420000, 5.0), (115000, 425000, 7.5)]),
+        shapely.Point(130000, 430000),
+    ]
+    data = gpd.GeoDataFrame(
+        {"name": list("abcd")}, geometry=gpd.GeoSeries(geometries, crs="EPSG:28992")
+    )
+
+    result = reproject.reproject_to_wgs84(data, max_workers=2)
+    expected = data.to_crs("EPSG:4326")
+
+    assert result.crs == expected.crs
+    assert list(shapely.has_z(result.geometry)) == [True, False, True, False]
+    assert shapely.equals_exact(
+        result.geometry.to_numpy(), expected.geometry.to_numpy(), tolerance=1e-9
+    ).all()
+    assert (
+        shapely.get_coordinates(result.geometry, include_z=True)[[0, 2, 3], 2]
+        == [10.0, 5.0, 7.5]
+    ).all()
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+from json2tab.location_converters.short_distance_remover import (
+    cleanup_short_distance_turbines,
+    split_long_short_distance_turbines,
+)
+
+
+def make_turbines(latitudes, longitudes):
+    return pd.DataFrame(
+        {
+            "name": [f"turbine {i}" for i in range(len(latitudes))],
+            "latitude": latitudes,
+            "longitude": longitudes,
+            "hub_height": [100.0] * len(latitudes),
+            "source": ["test"] * len(latitudes),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    ("latitudes", "expected_groups"),
+    [
+        # Isolated turbines
+        ([52.0, 52.01, 52.02], []),
+        # One pair of nearby turbines
+        ([52.0, 52.001, 52.02], [["turbine 0", "turbine 1"]]),
+        # Chain of nearby turbines (first and last are not nearby) forms one group
+        ([52.0, 52.001, 52.002, 52.02], [["turbine 0", "turbine 1", "turbine 2"]]),
+        # Groups are in data order, also when the chain is not sorted
+        ([52.002, 52.02, 52.0, 52.001], [["turbine 0", "turbine 2", "turbine 3"]]),
+    ],
+)
+def test_split_short_distance_groups(latitudes, expected_groups):
+    data = make_turbines(latitudes, [5.0] * len(latitudes))
+    unique, duplicate_groups, _ = split_long_short_distance_turbines(data, dist=1.5e-3)
+
+    groups = [[row["name"] for row in group] for group in duplicate_groups]
+    assert groups == expected_groups
+    assert len(unique.index) + sum(len(group) for group in groups) == len(data.index)
+
+
+def test_cleanup_merges_chain_in_single_pass():
+    data = make_turbines([52.0, 52.001, 52.002, 52.02], [5.0] * 4)
+    merged = cleanup_short_distance_turbines(data, dist=1.5e-3)
+
+    assert len(merged.index) == 2
+    assert sorted(merged["name"]) == ["turbine 0", "turbine 3"]